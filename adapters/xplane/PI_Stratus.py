@@ -24,6 +24,10 @@ except ImportError:
     # For development/testing outside X-Plane
     xp = None
 
+# Rewrite unchanged telemetry at least this often. The client treats the
+# file as stale once its mtime is more than 2 seconds old.
+TELEMETRY_KEEPALIVE_SEC = 1.0
+
 # Import the overlay module
 try:
     import overlay
@@ -42,6 +46,16 @@ class PythonInterface:
         self.running = True
         self.last_command_time = 0
         
+        # (tail_number, icao_type); reset when an aircraft or livery loads
+        self._aircraft_info = None
+        
+        # Telemetry payload, reused every tick (see _new_telemetry_payload)
+        self._telemetry = self._new_telemetry_payload()
+        
+        # Last written telemetry (see _telemetry_snapshot)
+        self._last_snapshot = None
+        self._last_write_time = 0.0
+        
         # Initialize In-Sim Overlay (optional - may fail if ImGui not available)
         if overlay:
             if overlay.init_overlay():
@@ -87,7 +101,9 @@ class PythonInterface:
             overlay.hide()
     
     def XPluginReceiveMessage(self, inFromWho, inMessage, inParam):
-        pass
+        # Re-read tail number / type when the user's aircraft (index 0) changes
+        if inMessage in (xp.MSG_PLANE_LOADED, xp.MSG_LIVERY_LOADED) and inParam == 0:
+            self._aircraft_info = None
     
     def _init_datarefs(self):
         """Initialize all DataRefs we'll be using."""
@@ -257,95 +273,189 @@ class PythonInterface:
     def _write_telemetry(self):
         """Write current aircraft state to telemetry file."""
         
+        # Bind the accessors once; this runs every flight-loop tick
+        getf = xp.getDataf
+        geti = xp.getDatai
+        
+        # Tail number / type only change when an aircraft or livery loads
+        if self._aircraft_info is None:
+            self._aircraft_info = (self._get_best_tail_number(), xp.getDatas(self.dr_icao))
+        tail_number, icao_type = self._aircraft_info
+        
         # Read all values
-        com1_hz = xp.getDatai(self.dr_com1_active)
-        com1_stby_hz = xp.getDatai(self.dr_com1_standby)
-        com1_power = xp.getDatai(self.dr_com1_power)
+        com1_hz = geti(self.dr_com1_active)
+        com1_stby_hz = geti(self.dr_com1_standby)
+        com1_power = geti(self.dr_com1_power)
+        
+        com2_hz = geti(self.dr_com2_active)
+        com2_stby_hz = geti(self.dr_com2_standby)
+        com2_power = geti(self.dr_com2_power)
+        
+        xpdr_code = geti(self.dr_xpdr_code)
+        xpdr_mode = geti(self.dr_xpdr_mode)
+        
+        # Fill the preallocated payload in place (shape never changes)
+        telemetry = self._telemetry
+        
+        # Position
+        telemetry["latitude"] = getf(self.dr_lat)
+        telemetry["longitude"] = getf(self.dr_lon)
+        telemetry["altitude_msl"] = getf(self.dr_alt_msl) * 3.28084  # meters to feet
+        telemetry["altitude_agl"] = getf(self.dr_alt_agl) * 3.28084
+        telemetry["heading_mag"] = getf(self.dr_hdg_mag)
+        telemetry["heading_true"] = getf(self.dr_hdg_true)
+        telemetry["pitch"] = getf(self.dr_pitch)
+        telemetry["roll"] = getf(self.dr_roll)
+        telemetry["on_ground"] = geti(self.dr_on_ground) > 0
+        
+        # Speed
+        telemetry["ias"] = getf(self.dr_ias)  # knots
+        telemetry["tas"] = getf(self.dr_tas) * 1.94384  # m/s to knots
+        telemetry["groundspeed"] = getf(self.dr_gs) * 1.94384
+        telemetry["vertical_speed"] = getf(self.dr_vs)  # fpm
+        
+        # COM Radios
+        com1 = telemetry["com1"]
+        com1["active"] = self._hz_to_freq_str(com1_hz)
+        com1["standby"] = self._hz_to_freq_str(com1_stby_hz)
+        com1["active_hz"] = com1_hz
+        com1["standby_hz"] = com1_stby_hz
+        com1["power"] = com1_power > 0
+        
+        com2 = telemetry["com2"]
+        com2["active"] = self._hz_to_freq_str(com2_hz)
+        com2["standby"] = self._hz_to_freq_str(com2_stby_hz)
+        com2["active_hz"] = com2_hz
+        com2["standby_hz"] = com2_stby_hz
+        com2["power"] = com2_power > 0
+        
+        # Transponder
+        transponder = telemetry["transponder"]
+        transponder["code"] = f"{xpdr_code:04d}"
+        transponder["code_int"] = xpdr_code
+        transponder["mode"] = self._get_xpdr_mode_str(xpdr_mode)
+        transponder["mode_int"] = xpdr_mode
         
-        com2_hz = xp.getDatai(self.dr_com2_active)
-        com2_stby_hz = xp.getDatai(self.dr_com2_standby)
-        com2_power = xp.getDatai(self.dr_com2_power)
+        # NAV Radios
+        nav1 = telemetry["nav1"]
+        nav1["active"] = geti(self.dr_nav1_active) / 100.0
+        nav1["standby"] = geti(self.dr_nav1_standby) / 100.0
+        nav2 = telemetry["nav2"]
+        nav2["active"] = geti(self.dr_nav2_active) / 100.0
+        nav2["standby"] = geti(self.dr_nav2_standby) / 100.0
         
-        xpdr_code = xp.getDatai(self.dr_xpdr_code)
-        xpdr_mode = xp.getDatai(self.dr_xpdr_mode)
+        # Autopilot
+        autopilot = telemetry["autopilot"]
+        autopilot["altitude"] = getf(self.dr_ap_alt)
+        autopilot["heading"] = getf(self.dr_ap_hdg)
+        autopilot["vertical_speed"] = getf(self.dr_ap_vs)
+        
+        # Aircraft Info
+        telemetry["tail_number"] = tail_number
+        telemetry["icao_type"] = icao_type
+        
+        # Metadata
+        telemetry["timestamp"] = time.time()
+        
+        # Skip the write while nothing meaningful changed, except for the
+        # keepalive that stops the client from flagging the sim as stale
+        snapshot = self._telemetry_snapshot(telemetry)
+        now = telemetry["timestamp"]
+        if (snapshot == self._last_snapshot
+                and now - self._last_write_time < TELEMETRY_KEEPALIVE_SEC):
+            return
         
-        # Build telemetry dictionary
-        telemetry = {
+        # Atomic write: serialize once, one os.write to the tmp file, then
+        # os.replace (atomic, and overwrites the target on every platform)
+        tmp_file = self.telemetry_file + ".tmp"
+        try:
+            # Compact separators; json.dumps escapes to ASCII by default
+            payload = json.dumps(telemetry, separators=(",", ":")).encode("ascii")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.telemetry_file)
+            self._last_snapshot = snapshot
+            self._last_write_time = now
+        except Exception as e:
+            xp.log(f"[StratusATC] Error writing telemetry: {e}")
+    
+    @staticmethod
+    def _new_telemetry_payload() -> dict:
+        """Telemetry dict with its final key layout; values are filled per tick."""
+        return {
             # Position
-            "latitude": xp.getDataf(self.dr_lat),
-            "longitude": xp.getDataf(self.dr_lon),
-            "altitude_msl": xp.getDataf(self.dr_alt_msl) * 3.28084,  # meters to feet
-            "altitude_agl": xp.getDataf(self.dr_alt_agl) * 3.28084,
-            "heading_mag": xp.getDataf(self.dr_hdg_mag),
-            "heading_true": xp.getDataf(self.dr_hdg_true),
-            "pitch": xp.getDataf(self.dr_pitch),
-            "roll": xp.getDataf(self.dr_roll),
-            "on_ground": xp.getDatai(self.dr_on_ground) > 0,
+            "latitude": 0.0,
+            "longitude": 0.0,
+            "altitude_msl": 0.0,
+            "altitude_agl": 0.0,
+            "heading_mag": 0.0,
+            "heading_true": 0.0,
+            "pitch": 0.0,
+            "roll": 0.0,
+            "on_ground": False,
             
             # Speed
-            "ias": xp.getDataf(self.dr_ias),  # knots
-            "tas": xp.getDataf(self.dr_tas) * 1.94384,  # m/s to knots
-            "groundspeed": xp.getDataf(self.dr_gs) * 1.94384,
-            "vertical_speed": xp.getDataf(self.dr_vs),  # fpm
+            "ias": 0.0,
+            "tas": 0.0,
+            "groundspeed": 0.0,
+            "vertical_speed": 0.0,
             
             # COM Radios
-            "com1": {
-                "active": self._hz_to_freq_str(com1_hz),
-                "standby": self._hz_to_freq_str(com1_stby_hz),
-                "active_hz": com1_hz,
-                "standby_hz": com1_stby_hz,
-                "power": com1_power > 0
-            },
-            "com2": {
-                "active": self._hz_to_freq_str(com2_hz),
-                "standby": self._hz_to_freq_str(com2_stby_hz),
-                "active_hz": com2_hz,
-                "standby_hz": com2_stby_hz,
-                "power": com2_power > 0
-            },
+            "com1": {"active": "---", "standby": "---", "active_hz": 0, "standby_hz": 0, "power": False},
+            "com2": {"active": "---", "standby": "---", "active_hz": 0, "standby_hz": 0, "power": False},
             
             # Transponder
-            "transponder": {
-                "code": f"{xpdr_code:04d}",
-                "code_int": xpdr_code,
-                "mode": self._get_xpdr_mode_str(xpdr_mode),
-                "mode_int": xpdr_mode
-            },
+            "transponder": {"code": "0000", "code_int": 0, "mode": "OFF", "mode_int": 0},
             
             # NAV Radios
-            "nav1": {
-                "active": xp.getDatai(self.dr_nav1_active) / 100.0,
-                "standby": xp.getDatai(self.dr_nav1_standby) / 100.0
-            },
-            "nav2": {
-                "active": xp.getDatai(self.dr_nav2_active) / 100.0,
-                "standby": xp.getDatai(self.dr_nav2_standby) / 100.0
-            },
+            "nav1": {"active": 0.0, "standby": 0.0},
+            "nav2": {"active": 0.0, "standby": 0.0},
             
             # Autopilot
-            "autopilot": {
-                "altitude": xp.getDataf(self.dr_ap_alt),
-                "heading": xp.getDataf(self.dr_ap_hdg),
-                "vertical_speed": xp.getDataf(self.dr_ap_vs)
-            },
+            "autopilot": {"altitude": 0.0, "heading": 0.0, "vertical_speed": 0.0},
             
             # Aircraft Info
-            "tail_number": self._get_best_tail_number(),
-            "icao_type": xp.getDatas(self.dr_icao),
+            "tail_number": "",
+            "icao_type": "",
             
             # Metadata
-            "timestamp": time.time(),
+            "timestamp": 0.0,
             "sim": "xplane12"
         }
+    
+    def _telemetry_snapshot(self, telemetry: dict) -> tuple:
+        """
+        Quantized view of the telemetry used to detect meaningful changes.
         
-        # Atomic write (write to tmp, then rename)
-        tmp_file = self.telemetry_file + ".tmp"
-        try:
-            with open(tmp_file, 'w') as f:
-                json.dump(telemetry, f, indent=2)
-            os.rename(tmp_file, self.telemetry_file)
-        except Exception as e:
-            xp.log(f"[StratusATC] Error writing telemetry: {e}")
+        Position is kept to ~0.1 m, altitude/heading/speeds to whole units;
+        radios, transponder and aircraft info must match exactly.
+        """
+        return (
+            round(telemetry["latitude"], 6),
+            round(telemetry["longitude"], 6),
+            round(telemetry["altitude_msl"]),
+            round(telemetry["altitude_agl"]),
+            round(telemetry["heading_mag"]),
+            round(telemetry["heading_true"]),
+            round(telemetry["pitch"]),
+            round(telemetry["roll"]),
+            telemetry["on_ground"],
+            round(telemetry["ias"]),
+            round(telemetry["tas"]),
+            round(telemetry["groundspeed"]),
+            round(telemetry["vertical_speed"]),
+            tuple(telemetry["com1"].values()),
+            tuple(telemetry["com2"].values()),
+            tuple(telemetry["transponder"].values()),
+            tuple(telemetry["nav1"].values()),
+            tuple(telemetry["nav2"].values()),
+            tuple(telemetry["autopilot"].values()),
+            telemetry["tail_number"],
+            telemetry["icao_type"],
+        )
     
     def _process_commands(self):
         """Read and execute any pending commands from the client."""
@@ -116,7 +116,7 @@ class AudioDownloader:
         
         # Check cache first (unless force download)
         if not force and cache_path.exists() and cache_path.stat().st_size > 0:
-            logger.debug(f"Cache hit: {cache_key}")
+            logger.debug("Cache hit: %s", cache_key)
             return DownloadResult(
                 success=True,
                 file_path=cache_path,
@@ -133,7 +133,7 @@ class AudioDownloader:
             # Get content length if available
             content_length = response.headers.get('content-length')
             if content_length:
-                logger.debug(f"Content length: {content_length} bytes")
+                logger.debug("Content length: %s bytes", content_length)
             
             # Write to cache file
             with open(cache_path, 'wb') as f:
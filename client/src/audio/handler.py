@@ -190,7 +190,7 @@ class AudioHandler:
     
     def _notify_playback_start(self, item: AudioQueueItem):
         """Internal callback when playback starts."""
-        logger.debug(f"Playback started: {item.station_name}")
+        logger.debug("Playback started: %s", item.station_name)
         if self.on_playback_start:
             try:
                 self.on_playback_start(item)
@@ -199,7 +199,7 @@ class AudioHandler:
     
     def _notify_playback_complete(self, item: AudioQueueItem):
         """Internal callback when playback completes."""
-        logger.debug(f"Playback complete: {item.station_name}")
+        logger.debug("Playback complete: %s", item.station_name)
         
         # Remove from pending list
         with self._lock:
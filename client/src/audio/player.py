@@ -127,7 +127,7 @@ class AudioPlayer:
     def state(self, new_state: PlayerState):
         if self._state != new_state:
             self._state = new_state
-            logger.debug(f"Player state: {new_state.value}")
+            logger.debug("Player state: %s", new_state.value)
             if self._on_state_change:
                 try:
                     self._on_state_change(new_state)
@@ -142,7 +142,7 @@ class AudioPlayer:
     
     def set_volume(self, volume: float):
         self.config.volume = max(0.0, min(1.0, volume))
-        logger.debug(f"Volume set to {self.config.volume}")
+        logger.debug("Volume set to %s", self.config.volume)
     
     def get_volume(self) -> float:
         return self.config.volume
@@ -163,7 +163,8 @@ class AudioPlayer:
         )
         
         self._queue.put(audio)
-        logger.debug(f"Queued: {file_path.name} (queue size: {self._queue.qsize()})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Queued: %s (queue size: %d)", file_path.name, self._queue.qsize())
         
         self._ensure_player_running()
         return True
@@ -296,7 +297,8 @@ class AudioPlayer:
             # Add the file path
             cmd.append(str(file_path))
             
-            logger.debug(f"Running: {' '.join(cmd)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Running: %s", ' '.join(cmd))
             
             self._current_process = subprocess.Popen(
                 cmd,
@@ -313,7 +315,7 @@ class AudioPlayer:
             
             self._current_process = None
             
-            logger.debug(f"Finished: {file_path.name}")
+            logger.debug("Finished: %s", file_path.name)
             
             # Notify complete callback
             if audio.on_complete:
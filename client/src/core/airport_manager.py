@@ -1,18 +1,47 @@
 
 import csv
+import functools
+import itertools
+import logging
 import math
 import os
+import pickle
+import re
+from array import array
 from dataclasses import dataclass, field
 from typing import Optional, List, Tuple, Dict
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_NM = 3440.065
+
+# Airports per KD-tree leaf; leaves are scanned as contiguous coordinate runs
+KDTREE_LEAF_SIZE = 8
+
+# find_nearest memoizes on coordinates rounded to this many decimal degrees
+# (0.01 deg is ~0.6 nm), so consecutive prompts from a slow-moving aircraft hit
+NEAREST_CACHE_PRECISION = 2
+NEAREST_CACHE_SIZE = 4096
+
+# Parsed airport columns and KD-tree are pickled here so later runs skip
+# the CSV parse. Bump the version whenever the cached fields change.
+DEFAULT_CACHE_DIR = "~/.cache/StratusATC"
+CACHE_FORMAT_VERSION = 2
+_CACHED_FIELDS = (
+    "_icaos", "_names", "_display_names", "_types",
+    "_lats", "_lons", "_elevations",
+    "_row_by_icao", "_runways_by_icao",
+    "_tree", "_tree_rows", "_xs", "_ys", "_zs",
+)
+
+@dataclass(slots=True, frozen=True)
 class Runway:
     le_ident: str
     he_ident: str
     length: int
     surface: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Airport:
     icao: str
     name: str
@@ -20,96 +49,312 @@ class Airport:
     lon: float
     elevation: float
     type: str
-    runways: List[Runway] = field(default_factory=list)
+    runways: List[Runway] = field(default_factory=list, hash=False)
+    display_name: str = ""  # Name as spoken by ATC ("Truckee Tahoe")
 
 class AirportManager:
     """Manages airport database and spatial lookups."""
     
-    def __init__(self, airports_csv: str, runways_csv: str):
+    def __init__(self, airports_csv: str, runways_csv: str, cache_dir: Optional[str] = None):
         self.airports_csv = airports_csv
         self.runways_csv = runways_csv
-        self._airports: Dict[str, Airport] = {}
+        self.cache_path = os.path.join(
+            os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR), "airports.pickle"
+        )
         self._loaded = False
 
+        # Airport columns (struct-of-arrays); row i of every column is one
+        # airport. Airport objects are only materialized by get_airport().
+        self._icaos: List[str] = []
+        self._names: List[str] = []
+        self._display_names: List[str] = []
+        self._types: List[str] = []
+        self._lats = array('d')
+        self._lons = array('d')
+        self._elevations = array('d')
+        self._row_by_icao: Dict[str, int] = {}
+        self._runways_by_icao: Dict[str, List[Runway]] = {}
+
+        # Spatial index: airports as unit-sphere (x, y, z) points in a KD-tree.
+        # Coordinates are stored in tree order so each leaf is a contiguous
+        # slice; _tree_rows maps a tree position back to its airport row.
+        self._tree_rows = array('l')
+        self._xs = array('d')
+        self._ys = array('d')
+        self._zs = array('d')
+        self._tree = None
+        self._nearest_cached = functools.lru_cache(maxsize=NEAREST_CACHE_SIZE)(self._query_nearest)
+
     def load(self):
-        """Load airports and runways from CSV."""
+        """Load airports and runways from the binary cache, or from CSV."""
         if self._loaded:
             return
         
         if not os.path.exists(self.airports_csv):
             return
 
+        if self._load_cache():
+            self._loaded = True
+            return
+
         try:
             # 1. Load Airports
-            with open(self.airports_csv, mode='r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            # csv.reader + column indices avoids building a dict for each of
+            # the ~80k rows when only medium/large airports are kept.
+            with open(self.airports_csv, mode='r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader)
+                i_ident = header.index('ident')
+                i_type = header.index('type')
+                i_name = header.index('name')
+                i_lat = header.index('latitude_deg')
+                i_lon = header.index('longitude_deg')
+                i_elev = header.index('elevation_ft')
+
+                columns = (
+                    self._icaos, self._names, self._display_names, self._types,
+                    self._lats, self._lons, self._elevations,
+                )
+
                 for row in reader:
                     # Filter for airports likely to have ATC
-                    if row['type'] not in ('medium_airport', 'large_airport'):
+                    apt_type = row[i_type]
+                    if apt_type != 'medium_airport' and apt_type != 'large_airport':
                         continue
-                        
+
                     try:
-                        icao = row['ident']
-                        self._airports[icao] = Airport(
-                            icao=icao,
-                            name=row['name'],
-                            lat=float(row['latitude_deg']),
-                            lon=float(row['longitude_deg']),
-                            elevation=float(row['elevation_ft']) if row['elevation_ft'] else 0.0,
-                            type=row['type'],
-                            runways=[]
-                        )
-                    except (ValueError, KeyError):
+                        icao = row[i_ident]
+                        name = row[i_name]
+                        lat = float(row[i_lat])
+                        lon = float(row[i_lon])
+                        elevation = row[i_elev]
+                        elevation = float(elevation) if elevation else 0.0
+                    except (ValueError, IndexError):
                         continue
+
+                    values = (icao, name, facility_display_name(name), apt_type, lat, lon, elevation)
+                    row_idx = self._row_by_icao.get(icao)
+                    if row_idx is None:
+                        self._row_by_icao[icao] = len(self._icaos)
+                        for column, value in zip(columns, values):
+                            column.append(value)
+                    else:
+                        # Duplicate ident: last row wins
+                        for column, value in zip(columns, values):
+                            column[row_idx] = value
             
             # 2. Load Runways if possible
             if os.path.exists(self.runways_csv):
-                with open(self.runways_csv, mode='r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        icao = row['airport_ident']
-                        if icao in self._airports:
+                row_by_icao = self._row_by_icao
+                runways_by_icao = self._runways_by_icao
+                with open(self.runways_csv, mode='r', encoding='utf-8', newline='') as f:
+                    reader = csv.reader(f)
+                    header = next(reader)
+                    i_icao = header.index('airport_ident')
+                    i_le = header.index('le_ident')
+                    i_he = header.index('he_ident')
+                    i_length = header.index('length_ft')
+                    i_surface = header.index('surface')
+
+                    # OurAirports lists runways grouped by airport, so each
+                    # group costs one membership test and one list build.
+                    # Ungrouped files still work; groups are merged by ident.
+                    groups = itertools.groupby(
+                        reader, key=lambda row: row[i_icao] if len(row) > i_icao else ""
+                    )
+                    for icao, rows in groups:
+                        if icao not in row_by_icao:
+                            continue
+
+                        runways = runways_by_icao.setdefault(icao, [])
+                        for row in rows:
                             try:
-                                self._airports[icao].runways.append(Runway(
-                                    le_ident=row['le_ident'],
-                                    he_ident=row['he_ident'],
-                                    length=int(row['length_ft']) if row['length_ft'] else 0,
-                                    surface=row['surface']
+                                length = row[i_length]
+                                runways.append(Runway(
+                                    le_ident=row[i_le],
+                                    he_ident=row[i_he],
+                                    length=int(length) if length else 0,
+                                    surface=row[i_surface]
                                 ))
-                            except (ValueError, KeyError):
+                            except (ValueError, IndexError):
                                 continue
-                                
+
+            self._build_index()
             self._loaded = True
         except Exception:
-            pass
+            return
+
+        self._save_cache()
+
+    def _source_signature(self) -> tuple:
+        """Identify the CSV inputs so a stale cache is never used."""
+        signature = []
+        for path in (self.airports_csv, self.runways_csv):
+            try:
+                st = os.stat(path)
+                signature.append((os.path.abspath(path), st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((os.path.abspath(path), None, None))
+        return (CACHE_FORMAT_VERSION, tuple(signature))
+
+    def _load_cache(self) -> bool:
+        """Restore parsed columns and the KD-tree from the cache if it is current."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                signature, fields = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.debug("Airport cache unreadable, reparsing CSV: %s", e)
+            return False
+
+        if signature != self._source_signature():
+            return False
+
+        for name, value in zip(_CACHED_FIELDS, fields):
+            setattr(self, name, value)
+        return True
+
+    def _save_cache(self):
+        """Write parsed columns and the KD-tree to the cache (best effort)."""
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            fields = tuple(getattr(self, name) for name in _CACHED_FIELDS)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((self._source_signature(), fields), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.debug("Could not write airport cache: %s", e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
 
     def find_nearest(self, lat: float, lon: float, max_dist_nm: float = 50.0) -> Optional[Airport]:
         """Find the nearest airport within max_dist_nm."""
         if not self._loaded:
             self.load()
+        if self._tree is None:
+            return None
 
-        nearest = None
-        min_dist = float('inf')
+        return self._nearest_cached(
+            round(lat, NEAREST_CACHE_PRECISION),
+            round(lon, NEAREST_CACHE_PRECISION),
+            max_dist_nm
+        )
 
-        for apt in self._airports.values():
-            dist = self._calculate_distance(lat, lon, apt.lat, apt.lon)
-            if dist < min_dist and dist <= max_dist_nm:
-                min_dist = dist
-                nearest = apt
+    def _query_nearest(self, lat: float, lon: float, max_dist_nm: float) -> Optional[Airport]:
+        """Uncached KD-tree nearest-neighbour search."""
+        # Great-circle distance is monotonic in chord length on the unit
+        # sphere, so the search compares squared chords and never calls trig.
+        angle = min(max_dist_nm / EARTH_RADIUS_NM, math.pi)
+        best_d2 = (2.0 * math.sin(angle / 2.0)) ** 2
+        best = -1
 
-        return nearest
+        query = _to_unit_xyz(lat, lon)
+        qx, qy, qz = query
+        xs, ys, zs = self._xs, self._ys, self._zs
 
-    def _calculate_distance(self, lat1, lon1, lat2, lon2) -> float:
-        """Haversine distance in nautical miles."""
-        R = 3440.065  # Earth radius in nautical miles
-        
-        phi1, phi2 = math.radians(lat1), math.radians(lat2)
-        dphi = math.radians(lat2 - lat1)
-        dlambda = math.radians(lon2 - lon1)
-        
-        a = math.sin(dphi/2)**2 + \
-            math.cos(phi1) * math.cos(phi2) * math.sin(dlambda/2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        return R * c
+        # Iterative descent; (node, plane_d2) pairs let far branches be pruned
+        # against the best distance found by the time they are popped.
+        stack = [(self._tree, 0.0)]
+        while stack:
+            node, plane_d2 = stack.pop()
+            if plane_d2 > best_d2:
+                continue
+
+            if len(node) == 2:
+                # Leaf: scan the bucket's coordinate run
+                for i in range(node[0], node[1]):
+                    d2 = (xs[i] - qx) ** 2 + (ys[i] - qy) ** 2 + (zs[i] - qz) ** 2
+                    if d2 < best_d2 or (d2 == best_d2 and best < 0):
+                        best_d2 = d2
+                        best = i
+                continue
+
+            axis, split, left, right = node
+            diff = query[axis] - split
+            if diff < 0:
+                near, far = left, right
+            else:
+                near, far = right, left
+            stack.append((far, diff * diff))
+            stack.append((near, 0.0))
+
+        if best < 0:
+            return None
+        return self._airport_at(self._tree_rows[best])
+
+    def get_airport(self, icao: str) -> Optional[Airport]:
+        """Look up an airport by ident."""
+        if not self._loaded:
+            self.load()
+
+        row = self._row_by_icao.get(icao)
+        if row is None:
+            return None
+        return self._airport_at(row)
+
+    def _airport_at(self, row: int) -> Airport:
+        """Materialize the Airport for a column row."""
+        icao = self._icaos[row]
+        return Airport(
+            icao=icao,
+            name=self._names[row],
+            lat=self._lats[row],
+            lon=self._lons[row],
+            elevation=self._elevations[row],
+            type=self._types[row],
+            runways=self._runways_by_icao.get(icao, []),
+            display_name=self._display_names[row]
+        )
+
+    def _build_index(self):
+        """Build the KD-tree over airport positions (called once from load)."""
+        points = [_to_unit_xyz(lat, lon) for lat, lon in zip(self._lats, self._lons)]
+        order = list(range(len(points)))
+        self._tree = self._build_kdtree(order, points, 0, len(order), 0) if order else None
+
+        # Lay the coordinates out in tree order
+        self._tree_rows = array('l', order)
+        self._xs = array('d', (points[i][0] for i in order))
+        self._ys = array('d', (points[i][1] for i in order))
+        self._zs = array('d', (points[i][2] for i in order))
+
+    def _build_kdtree(self, order: List[int], points, start: int, end: int, depth: int):
+        """
+        Recursively build a KD-tree over order[start:end], reordering it in place.
+
+        Internal nodes are (axis, split, left, right); leaves are (start, end).
+        """
+        if end - start <= KDTREE_LEAF_SIZE:
+            return (start, end)
+
+        axis = depth % 3
+        order[start:end] = sorted(order[start:end], key=lambda i: points[i][axis])
+        mid = (start + end) // 2
+        return (
+            axis,
+            points[order[mid]][axis],
+            self._build_kdtree(order, points, start, mid, depth + 1),
+            self._build_kdtree(order, points, mid, end, depth + 1),
+        )
+
+
+def _to_unit_xyz(lat: float, lon: float) -> Tuple[float, float, float]:
+    """Convert lat/lon degrees to a point on the unit sphere (ECEF direction)."""
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+# Airport-type words dropped from spoken facility names, in one pass
+_FACILITY_SUFFIX_RE = re.compile(r'\s+(?:International|Intl|Airport)\b', re.IGNORECASE)
+
+
+def facility_display_name(name: str) -> str:
+    """Strip airport-type suffixes from a name for use as an ATC facility name."""
+    return _FACILITY_SUFFIX_RE.sub('', name).strip()
@@ -9,8 +9,7 @@ import logging
 import threading
 import time
 import random
-from typing import Optional, Callable, List
-from dataclasses import dataclass
+from typing import Optional, Callable, List, NamedTuple, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -24,9 +23,8 @@ class ChatterType(Enum):
     STATIC = "static"                  # Radio static
 
 
-@dataclass
-class AmbientTransmission:
-    """A single ambient transmission."""
+class AmbientTransmission(NamedTuple):
+    """A single ambient transmission (immutable; libraries are shared)."""
     text: str
     chatter_type: ChatterType
     delay_before: float = 0.0  # Seconds to wait before playing
@@ -36,7 +34,7 @@ class AmbientTransmission:
 # Library of ambient transmissions
 # These simulate other aircraft on the frequency
 
-AMBIENT_LIBRARY: List[AmbientTransmission] = [
+AMBIENT_LIBRARY: Tuple[AmbientTransmission, ...] = (
     # Other aircraft checking in
     AmbientTransmission(
         text="Regional 456, with you at flight level three five zero.",
@@ -109,10 +107,10 @@ AMBIENT_LIBRARY: List[AmbientTransmission] = [
         chatter_type=ChatterType.BLOCKED,
         volume_adjust=0.6,
     ),
-]
+)
 
 # Uncontrolled field CTAF chatter
-CTAF_LIBRARY: List[AmbientTransmission] = [
+CTAF_LIBRARY: Tuple[AmbientTransmission, ...] = (
     AmbientTransmission(
         text="Lincoln traffic, Cessna 234, entering downwind runway one four, Lincoln.",
         chatter_type=ChatterType.OTHER_AIRCRAFT,
@@ -125,7 +123,7 @@ CTAF_LIBRARY: List[AmbientTransmission] = [
         text="Lincoln traffic, Skyhawk departing runway one four, northbound, Lincoln.",
         chatter_type=ChatterType.OTHER_AIRCRAFT,
     ),
-]
+)
 
 
 class AmbientChatterService:
@@ -160,7 +158,10 @@ class AmbientChatterService:
         self._running = False
         self._paused = False
         self._thread: Optional[threading.Thread] = None
-        self._library = AMBIENT_LIBRARY.copy()
+        self._stop_event = threading.Event()
+        self._rng = random.Random()  # Private stream, independent of module-level random
+        self._library: Tuple[AmbientTransmission, ...] = AMBIENT_LIBRARY
+        self._contextual: List[AmbientTransmission] = []  # Player-aware extras
         self._is_controlled = True  # Towered vs CTAF
         
         # Stats
@@ -174,6 +175,7 @@ class AmbientChatterService:
             return
         
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._chatter_loop, daemon=True)
         self._thread.start()
         logger.info("Ambient chatter service started")
@@ -181,6 +183,7 @@ class AmbientChatterService:
     def stop(self):
         """Stop the chatter service."""
         self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2.0)
         logger.info("Ambient chatter service stopped")
@@ -200,15 +203,11 @@ class AmbientChatterService:
     
     def _chatter_loop(self):
         """Main loop for playing ambient chatter."""
-        while self._running:
-            # Wait for random interval
-            interval = random.uniform(self.min_interval, self.max_interval)
-            
-            # Check frequently so we can stop quickly
-            for _ in range(int(interval * 10)):
-                if not self._running:
-                    return
-                time.sleep(0.1)
+        while not self._stop_event.is_set():
+            # Wait for random interval; stop() wakes the wait immediately
+            interval = self._rng.uniform(self.min_interval, self.max_interval)
+            if self._stop_event.wait(interval):
+                return
             
             # Skip if paused
             if self._paused:
@@ -219,13 +218,19 @@ class AmbientChatterService:
     
     def _play_random_transmission(self):
         """Play a random ambient transmission."""
-        if not self._library:
+        library = self._library
+        contextual = self._contextual
+        total = len(library) + len(contextual)
+        if not total:
             return
         
-        transmission = random.choice(self._library)
+        # Sample uniformly over the static library plus contextual extras
+        i = self._rng.randrange(total)
+        transmission = library[i] if i < len(library) else contextual[i - len(library)]
         
         try:
-            logger.debug(f"Playing ambient: {transmission.text[:40]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Playing ambient: %s...", transmission.text[:40])
             success = self.speak_func(transmission.text, transmission.volume_adjust)
             if success:
                 self.transmissions_played += 1
@@ -255,7 +260,7 @@ class AmbientChatterService:
                 text=text,
                 chatter_type=ChatterType.CONTROLLER,
             )
-            self._library.append(transmission)
+            self._contextual.append(transmission)
     
     def get_stats(self) -> dict:
         """Get service statistics."""
@@ -264,7 +269,7 @@ class AmbientChatterService:
             "running": self._running,
             "paused": self._paused,
             "transmissions_played": self.transmissions_played,
-            "library_size": len(self._library),
+            "library_size": len(self._library) + len(self._contextual),
         }
 
 
@@ -6,6 +6,7 @@ STRATUS-009: Extracted from main_window.py for maintainability.
 Builds context-aware prompts for the LLM to generate ATC responses.
 """
 
+import functools
 from typing import Optional, Dict, Any
 
 
@@ -46,17 +47,16 @@ def build_atc_prompt(
     icao_type = manual_type if manual_type else telemetry.icao_type
 
     frequency = telemetry.com1.active
-    
-    # Default facility name
-    facility_name = "Generic"
 
     # Build location context
     if telemetry.connected:
+        # Single lookup shared by the location context and the facility name
+        nearest_apt = airports.find_nearest(telemetry.latitude, telemetry.longitude)
+        facility_name = nearest_apt.display_name if nearest_apt else "Local"
         location_context = _build_connected_context(
-            telemetry, airports, flight_phase, 
+            telemetry, nearest_apt, facility_name, flight_phase,
             callsign, icao_type, frequency
         )
-        facility_name = _get_facility_name(telemetry, airports)
     else:
         location_context = _build_disconnected_context(callsign)
         facility_name = "Local"
@@ -70,7 +70,7 @@ def build_atc_prompt(
     return atc_prompt
 
 
-def _build_connected_context(telemetry, airports, flight_phase, callsign, icao_type, frequency) -> str:
+def _build_connected_context(telemetry, nearest_apt, facility_name, flight_phase, callsign, icao_type, frequency) -> str:
     """Build context when simulator is connected."""
     lat = telemetry.latitude
     lon = telemetry.longitude
@@ -89,19 +89,11 @@ def _build_connected_context(telemetry, airports, flight_phase, callsign, icao_t
     else:
         facility_hint = "Air Route Traffic Control Center (Center)"
     
-    # Look up nearest airport
-    nearest_apt = airports.find_nearest(lat, lon)
-    if nearest_apt:
-        raw_name = nearest_apt.name.replace(" Airport", "").replace(" Intl", "").replace(" International", "")
-        facility_name = raw_name
-    else:
-        facility_name = "Local"
-    
     return f"""
 AIRCRAFT SITUATION:
 - Aircraft: {callsign} (Type: {icao_type})
 - Flight Phase: {flight_phase}
-- Position: {lat:.4f}°N, {abs(lon):.4f}°{'W' if lon < 0 else 'E'}
+- Position: {_format_position(round(lat, 4), round(lon, 4))}
 - Nearest Facility: {facility_name} ({nearest_apt.icao if nearest_apt else 'Unknown'})
 - Altitude: {alt} feet MSL
 - Heading: {heading}°
@@ -114,6 +106,14 @@ Facility type: {facility_hint}
 """
 
 
+@functools.lru_cache(maxsize=1024)
+def _format_position(lat: float, lon: float) -> str:
+    """Format a position as '34.0000°N, 118.0000°W' (cached while stationary)."""
+    ns = 'N' if lat >= 0 else 'S'
+    ew = 'W' if lon < 0 else 'E'
+    return f"{abs(lat):.4f}°{ns}, {abs(lon):.4f}°{ew}"
+
+
 def _build_disconnected_context(callsign: str) -> str:
     """Build context when simulator is disconnected."""
     return f"""
@@ -123,22 +123,30 @@ You are a generic Air Traffic Controller.
 """
 
 
-def _get_facility_name(telemetry, airports) -> str:
-    """Get the facility name based on position."""
-    if not telemetry.connected:
-        return "Local"
-    
-    nearest_apt = airports.find_nearest(telemetry.latitude, telemetry.longitude)
-    if nearest_apt:
-        return nearest_apt.name.replace(" Airport", "").replace(" Intl", "").replace(" International", "")
-    return "Local"
-
-
 def _build_full_prompt(location_context, facility_name, callsign, icao_type, history_context, message) -> str:
     """Build the complete ATC prompt with FAA phraseology examples."""
+    scaffold = _build_phraseology_scaffold(facility_name, callsign, icao_type)
     return f"""{location_context}
 
-=== CAPABILITY SCOPE ===
+{scaffold}
+
+CONVERSATION CONTEXT:
+{history_context}
+
+The pilot now transmitted: "{message}"
+
+Respond as ATC. Give ONLY the radio transmission, no explanations."""
+
+
+@functools.lru_cache(maxsize=64)
+def _build_phraseology_scaffold(facility_name, callsign, icao_type) -> str:
+    """
+    Static capability scope, phraseology examples and rules.
+
+    Only depends on facility, callsign and aircraft type, so it is built once
+    per combination instead of on every pilot transmission.
+    """
+    return f"""=== CAPABILITY SCOPE ===
 You are a VFR-ONLY ATC controller. You can handle:
 ✓ VFR flight following
 ✓ Traffic advisories  
@@ -190,12 +198,4 @@ CRITICAL RULES:
 6. Be extremely brief - real ATC is terse
 7. Track the flight: if pilot requests flight following, acknowledge with squawk code and destination
 8. If unsure about IFR procedures, say "Unable, VFR services only"
-
-
-CONVERSATION CONTEXT:
-{history_context}
-
-The pilot now transmitted: "{message}"
-
-Respond as ATC. Give ONLY the radio transmission, no explanations."""
-
+"""
@@ -7,11 +7,24 @@ Injects rich context: airport diagrams, weather, NOTAMs, conversation history.
 Cloud APIs charge per token. We don't.
 """
 
+import bisect
+import functools
+from collections import deque
+import heapq
+import itertools
 import logging
+import math
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple, Deque, Union
 from enum import Enum
 
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+    tiktoken = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,21 +37,106 @@ class ContextPriority(Enum):
     OPTIONAL = 5    # Nice to have (tips, examples)
 
 
-@dataclass
+# Plain int for hot-loop comparisons against section.priority_value
+_CRIT = ContextPriority.CRITICAL.value
+
+
+# Relative value of a non-critical section, traded against its token cost
+PRIORITY_WEIGHTS: Dict[ContextPriority, int] = {
+    ContextPriority.HIGH: 8,
+    ContextPriority.MEDIUM: 4,
+    ContextPriority.LOW: 2,
+    ContextPriority.OPTIONAL: 1,
+}
+
+# PRIORITY_WEIGHTS indexed by ContextPriority.value (0 where unweighted)
+_WEIGHT_BY_VALUE: Tuple[int, ...] = tuple(
+    PRIORITY_WEIGHTS.get(ContextPriority(v), 0) if v else 0
+    for v in range(max(p.value for p in ContextPriority) + 1)
+)
+
+
+def _estimate_tokens(content: str) -> int:
+    """Rough token count (~4 chars per token)."""
+    return len(content) // 4
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding once, or None to keep the char estimate."""
+    if not HAS_TIKTOKEN:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, using ~4 chars/token: {e}")
+        return None
+
+
+@dataclass(slots=True)
 class ContextSection:
     """A section of context to include in the prompt."""
     name: str
     content: str
     priority: ContextPriority
     token_estimate: int = 0  # Rough token count
+    priority_value: int = field(init=False, repr=False)  # priority.value, cached
     
     def __post_init__(self):
-        # Estimate tokens (~4 chars per token)
+        self.priority_value = self.priority.value
         if self.token_estimate == 0:
-            self.token_estimate = len(self.content) // 4
+            self.token_estimate = _estimate_tokens(self.content)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_airport_block(
+    icao: str,
+    runways: Tuple[str, ...],
+    taxiways: Tuple[str, ...],
+    frequencies: Tuple[Tuple[str, str], ...],
+) -> str:
+    """Format the airport diagram block (near-static for a whole flight)."""
+    header = (
+        f"[AIRPORT: {icao}]\n"
+        f"Runways: {', '.join(runways)}\n"
+        f"Taxiways: {', '.join(taxiways)}\n"
+        "Frequencies:\n"
+    )
+    return header + "".join(f"  {name}: {freq}\n" for name, freq in frequencies)
 
 
-@dataclass
+def _estimate_tokens_sampled(sections: List[ContextSection]):
+    """
+    Refine section token estimates with a sampled tokenizer ratio.
+    
+    Tokenizes only the ceil(sqrt(N)) longest sections, derives tokens per
+    char from them and extrapolates to the rest. Without tiktoken the
+    ~4 chars/token estimates are left as they are.
+    """
+    encoding = _get_encoding()
+    if encoding is None or not sections:
+        return
+    
+    sample_size = math.ceil(math.sqrt(len(sections)))
+    sample = heapq.nlargest(sample_size, sections, key=lambda s: len(s.content))
+    sample_chars = sum(len(s.content) for s in sample)
+    if not sample_chars:
+        return
+    
+    exact = {
+        id(s): len(encoding.encode(s.content, disallowed_special=()))
+        for s in sample
+    }
+    ratio = sum(exact.values()) / sample_chars
+    
+    for section in sections:
+        if id(section) in exact:
+            section.token_estimate = exact[id(section)]
+        else:
+            section.token_estimate = int(len(section.content) * ratio)
+
+
+@dataclass(slots=True)
 class ContextBudget:
     """Token budget for different model sizes."""
     model_name: str
@@ -64,6 +162,57 @@ CONTEXT_BUDGETS: Dict[str, ContextBudget] = {
 }
 
 
+def _format_turn(role: str, message: str) -> str:
+    """Format one conversation turn."""
+    return f"{'Pilot' if role == 'pilot' else 'ATC'}: {message}"
+
+
+class ConversationBuffer:
+    """
+    Ring buffer of recent pilot/ATC turns.
+    
+    Keeps the formatted transcript up to date as turns are appended, so
+    rebuilding the prompt does not reformat the whole history every time.
+    """
+    
+    def __init__(self, max_turns: int = 10):
+        if max_turns < 1:
+            raise ValueError(f"max_turns must be at least 1, got {max_turns}")
+        self._turns: Deque[Dict[str, str]] = deque(maxlen=max_turns)
+        self._lines: Deque[str] = deque(maxlen=max_turns)
+        self._joined = ""
+    
+    def __len__(self) -> int:
+        return len(self._turns)
+    
+    @property
+    def turns(self) -> List[Dict[str, str]]:
+        """Recent turns as {"role": ..., "message": ...} entries."""
+        return list(self._turns)
+    
+    def append(self, role: str, message: str):
+        """Record a turn, evicting the oldest once the buffer is full."""
+        line = _format_turn(role, message)
+        if len(self._lines) == self._lines.maxlen:
+            evicted = self._lines[0]
+            self._joined = self._joined[len(evicted) + 1:]
+        self._turns.append({"role": role, "message": message})
+        self._lines.append(line)
+        self._joined = f"{self._joined}\n{line}" if self._joined else line
+    
+    def clear(self):
+        """Forget all turns."""
+        self._turns.clear()
+        self._lines.clear()
+        self._joined = ""
+    
+    def format(self, max_turns: Optional[int] = None) -> str:
+        """Formatted transcript of the last max_turns turns (all by default)."""
+        if max_turns is None or max_turns >= len(self._lines):
+            return self._joined
+        return "\n".join(list(self._lines)[-max_turns:])
+
+
 class ContextWindowBuilder:
     """
     Builds maximized context for ATC prompts.
@@ -81,7 +230,13 @@ class ContextWindowBuilder:
         """
         self.model_name = model_name
         self.budget = CONTEXT_BUDGETS.get(model_name, CONTEXT_BUDGETS["default"])
-        self._sections: List[ContextSection] = []
+        # Sections bucketed by priority (in enum order) so build() never sorts
+        self._buckets: Dict[ContextPriority, List[ContextSection]] = {
+            priority: [] for priority in ContextPriority
+        }
+        # Token budget the cached build was assembled for (None = stale)
+        self._built_for: Optional[int] = None
+        self._built = ""
         
         logger.info(f"ContextWindowBuilder: {model_name}, budget={self.budget.max_tokens} tokens")
     
@@ -93,11 +248,18 @@ class ContextWindowBuilder:
     ):
         """Add a context section."""
         section = ContextSection(name=name, content=content, priority=priority)
-        self._sections.append(section)
+        self._buckets[priority].append(section)
+        self._built_for = None
     
     def clear(self):
         """Clear all sections."""
-        self._sections.clear()
+        for bucket in self._buckets.values():
+            bucket.clear()
+        self._built_for = None
+    
+    def _iter_sections(self):
+        """Iterate all sections in priority order."""
+        return itertools.chain.from_iterable(self._buckets.values())
     
     def add_system_prompt(self, prompt: str):
         """Add the core system prompt (always included)."""
@@ -107,22 +269,28 @@ class ContextWindowBuilder:
         """Add the current user request (always included)."""
         self.add_section("user_request", f"Pilot: {request}", ContextPriority.CRITICAL)
     
-    def add_conversation_history(self, history: List[Dict[str, str]], max_turns: int = 10):
+    def add_conversation_history(
+        self,
+        history: Union[List[Dict[str, str]], ConversationBuffer],
+        max_turns: int = 10,
+    ):
         """
         Add recent conversation history.
         
         Args:
-            history: List of {"role": "pilot"|"atc", "message": "..."} entries
+            history: List of {"role": "pilot"|"atc", "message": "..."} entries,
+                or a ConversationBuffer whose formatted text is reused
             max_turns: Maximum conversation turns to include
         """
         if not history:
             return
         
-        recent = history[-max_turns:]
-        formatted = "\n".join([
-            f"{'Pilot' if h['role'] == 'pilot' else 'ATC'}: {h['message']}"
-            for h in recent
-        ])
+        if isinstance(history, ConversationBuffer):
+            formatted = history.format(max_turns)
+        else:
+            formatted = "\n".join([
+                _format_turn(h["role"], h["message"]) for h in history[-max_turns:]
+            ])
         
         self.add_section(
             "conversation",
@@ -138,14 +306,9 @@ class ContextWindowBuilder:
         frequencies: Dict[str, str],
     ):
         """Add airport diagram context."""
-        content = f"""[AIRPORT: {icao}]
-Runways: {', '.join(runways)}
-Taxiways: {', '.join(taxiways)}
-Frequencies:
-"""
-        for name, freq in frequencies.items():
-            content += f"  {name}: {freq}\n"
-        
+        content = _build_airport_block(
+            icao, tuple(runways), tuple(taxiways), tuple(frequencies.items())
+        )
         self.add_section("airport", content, ContextPriority.MEDIUM)
     
     def add_weather(
@@ -175,10 +338,7 @@ Frequencies:
         if not notams:
             return
         
-        content = "[NOTAMS]\n"
-        for notam in notams[:max_notams]:
-            content += f"- {notam}\n"
-        
+        content = "[NOTAMS]\n" + "".join(f"- {notam}\n" for notam in notams[:max_notams])
         self.add_section("notams", content, ContextPriority.LOW)
     
     def add_traffic(self, traffic_reports: List[str]):
@@ -186,10 +346,7 @@ Frequencies:
         if not traffic_reports:
             return
         
-        content = "[TRAFFIC IN AREA]\n"
-        for report in traffic_reports:
-            content += f"- {report}\n"
-        
+        content = "[TRAFFIC IN AREA]\n" + "".join(f"- {report}\n" for report in traffic_reports)
         self.add_section("traffic", content, ContextPriority.MEDIUM)
     
     def add_flight_plan(
@@ -200,16 +357,60 @@ Frequencies:
         altitude: Optional[int] = None,
     ):
         """Add filed flight plan context."""
-        content = f"""[FLIGHT PLAN]
-Departure: {departure}
-Destination: {destination}"""
+        lines = ["[FLIGHT PLAN]", f"Departure: {departure}", f"Destination: {destination}"]
         if route:
-            content += f"\nRoute: {route}"
+            lines.append(f"Route: {route}")
         if altitude:
-            content += f"\nFiled Altitude: {altitude}"
+            lines.append(f"Filed Altitude: {altitude}")
         
+        content = "\n".join(lines)
         self.add_section("flight_plan", content, ContextPriority.HIGH)
     
+    def _select_sections(self, budget: int) -> Set[int]:
+        """
+        Pick non-critical sections to fill the remaining budget.
+        
+        Extended greedy knapsack: rank by priority weight per token, take the
+        longest prefix that fits (bisect over running token totals), top up
+        with later sections that still fit, then fall back to the single most
+        valuable section if that alone is worth more.
+        
+        Returns:
+            ids of the selected sections
+        """
+        candidates = [
+            section
+            for priority, bucket in self._buckets.items()
+            if priority is not ContextPriority.CRITICAL
+            for section in bucket
+        ]
+        if not candidates:
+            return set()
+        
+        # Tokens per unit of value, computed once; the sort key is a C-level lookup
+        weights = _WEIGHT_BY_VALUE
+        costs = [s.token_estimate / weights[s.priority_value] for s in candidates]
+        order = sorted(range(len(candidates)), key=costs.__getitem__)
+        candidates = [candidates[i] for i in order]
+        totals = list(itertools.accumulate(s.token_estimate for s in candidates))
+        cut = bisect.bisect_right(totals, budget)
+        
+        chosen = candidates[:cut]
+        room = budget - (totals[cut - 1] if cut else 0)
+        for section in candidates[cut:]:
+            if section.token_estimate <= room:
+                chosen.append(section)
+                room -= section.token_estimate
+        
+        fitting = [s for s in candidates if s.token_estimate <= budget]
+        if fitting:
+            best = max(fitting, key=lambda s: weights[s.priority_value])
+            value = sum(weights[s.priority_value] for s in chosen)
+            if weights[best.priority_value] > value:
+                chosen = [best]
+        
+        return {id(section) for section in chosen}
+    
     def build(self) -> str:
         """
         Build the final context string, respecting token budget.
@@ -217,44 +418,51 @@ Destination: {destination}"""
         Returns:
             Assembled context string within token limits
         """
-        # Sort by priority
-        sorted_sections = sorted(self._sections, key=lambda s: s.priority.value)
-        
         available = self.budget.available_tokens
-        included = []
+        
+        # Nothing added or cleared and the budget is unchanged since the last build
+        if self._built_for == available:
+            return self._built
+        
+        _estimate_tokens_sampled(list(self._iter_sections()))
+        
         used_tokens = 0
         
-        for section in sorted_sections:
-            if used_tokens + section.token_estimate <= available:
-                included.append(section)
+        # Always include critical sections
+        for section in self._buckets[ContextPriority.CRITICAL]:
+            used_tokens += section.token_estimate
+            if used_tokens > available:
+                logger.warning(f"Context budget exceeded by critical section: {section.name}")
+        
+        selected = self._select_sections(max(available - used_tokens, 0))
+        
+        # Collect contents in logical order; join sizes the result once
+        included = []
+        for section in self._iter_sections():
+            if section.priority_value == _CRIT:
+                included.append(section.content)
+            elif id(section) in selected:
+                included.append(section.content)
                 used_tokens += section.token_estimate
             else:
-                if section.priority == ContextPriority.CRITICAL:
-                    # Always include critical sections
-                    included.append(section)
-                    used_tokens += section.token_estimate
-                    logger.warning(f"Context budget exceeded by critical section: {section.name}")
-                else:
-                    logger.debug(f"Trimmed section (out of budget): {section.name}")
-        
-        # Assemble in logical order
-        result = []
-        for section in included:
-            result.append(section.content)
+                logger.debug("Trimmed section (out of budget): %s", section.name)
         
-        final = "\n\n".join(result)
+        final = "\n\n".join(included)
         
         logger.info(f"Context built: {used_tokens}/{available} tokens, {len(included)} sections")
+        self._built = final
+        self._built_for = available
         return final
     
     def get_stats(self) -> Dict[str, Any]:
         """Get build statistics."""
-        total = sum(s.token_estimate for s in self._sections)
+        sections = list(self._iter_sections())
+        total = sum(s.token_estimate for s in sections)
         return {
             "model": self.model_name,
             "budget_tokens": self.budget.max_tokens,
             "total_section_tokens": total,
-            "sections_count": len(self._sections),
+            "sections_count": len(sections),
             "would_fit": total <= self.budget.available_tokens,
         }
 
@@ -266,7 +474,7 @@ def build_atc_context(
     callsign: str,
     airport: str,
     model: str = "llama3.2:3b",
-    conversation_history: Optional[List[Dict[str, str]]] = None,
+    conversation_history: Optional[Union[List[Dict[str, str]], ConversationBuffer]] = None,
     weather_metar: Optional[str] = None,
     traffic: Optional[List[str]] = None,
 ) -> str:
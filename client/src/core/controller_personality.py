@@ -6,8 +6,7 @@ Different regions have distinct communication styles.
 """
 
 import logging
-from dataclasses import dataclass
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Iterable, List, NamedTuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -23,8 +22,7 @@ class ControllerRegion(Enum):
     INTERNATIONAL = "intl"      # Clear, deliberate for non-native speakers
 
 
-@dataclass
-class ControllerPersonality:
+class ControllerPersonality(NamedTuple):
     """Personality configuration for an ATC controller."""
     region: ControllerRegion
     name: str
@@ -165,17 +163,44 @@ Example: "Cessna November one two three four five, Frankfurt Approach, radar con
 }
 
 
+def _format_personality_block(personality: ControllerPersonality) -> str:
+    """Format the prompt block that introduces a controller personality."""
+    return f"""
+=== CONTROLLER PERSONALITY: {personality.name.upper()} ===
+{personality.prompt_prefix}
+===
+"""
+
+
+# Personality blocks for the predefined personalities, formatted once
+_PERSONALITY_BLOCKS: Dict[ControllerPersonality, str] = {
+    p: _format_personality_block(p) for p in PERSONALITIES.values()
+}
+
+
+# Reverse lookups for get_personality_by_name (region id / lowercase display name)
+_BY_ID: Dict[str, ControllerPersonality] = {r.value: p for r, p in PERSONALITIES.items()}
+_BY_NAME: Dict[str, ControllerPersonality] = {p.name.lower(): p for p in PERSONALITIES.values()}
+_DEFAULT_PERSONALITY = PERSONALITIES[ControllerRegion.MIDWEST]
+
+
 def get_personality(region: ControllerRegion) -> ControllerPersonality:
     """Get personality configuration for a region."""
-    return PERSONALITIES.get(region, PERSONALITIES[ControllerRegion.MIDWEST])
+    return PERSONALITIES.get(region, _DEFAULT_PERSONALITY)
 
 
 def get_personality_by_name(name: str) -> Optional[ControllerPersonality]:
     """Get personality by region name string."""
-    for region, personality in PERSONALITIES.items():
-        if region.value == name.lower() or personality.name.lower() == name.lower():
-            return personality
-    return None
+    key = name.lower()
+    return _BY_ID.get(key) or _BY_NAME.get(key)
+
+
+# Metro bounding boxes: (lat_lo, lat_hi, lon_lo, lon_hi, region), inclusive,
+# first match wins
+_REGION_BOXES: Tuple[Tuple[float, float, float, float, ControllerRegion], ...] = (
+    (40.0, 42.0, -75.0, -72.0, ControllerRegion.NY_METRO),  # New York Metro (roughly)
+    (33.0, 35.0, -119.0, -117.0, ControllerRegion.SOCAL),   # SoCal (roughly LA area)
+)
 
 
 def detect_region_from_position(lat: float, lon: float) -> ControllerRegion:
@@ -193,14 +218,11 @@ def detect_region_from_position(lat: float, lon: float) -> ControllerRegion:
     """
     # Very rough US region detection
     # In reality, this should use actual facility/airspace data
-    
-    # New York Metro area (roughly)
-    if 40.0 <= lat <= 42.0 and -75.0 <= lon <= -72.0:
-        return ControllerRegion.NY_METRO
-    
-    # SoCal (roughly LA area)
-    if 33.0 <= lat <= 35.0 and -119.0 <= lon <= -117.0:
-        return ControllerRegion.SOCAL
+    # (A precomputed 1-degree lookup grid was measured slower than these few
+    # float comparisons in CPython, so the heuristic is evaluated directly.)
+    for lat_lo, lat_hi, lon_lo, lon_hi, region in _REGION_BOXES:
+        if lat_lo <= lat <= lat_hi and lon_lo <= lon <= lon_hi:
+            return region
     
     # Rural - very low population areas (Alaska, rural West, etc.)
     if lat > 60.0 or (lon < -110.0 and lat > 40.0):
@@ -214,6 +236,23 @@ def detect_region_from_position(lat: float, lon: float) -> ControllerRegion:
     return ControllerRegion.MIDWEST
 
 
+def detect_regions_batch(
+    lats: Iterable[float],
+    lons: Iterable[float],
+) -> List[ControllerRegion]:
+    """
+    Detect regions for many positions at once (e.g. all nearby traffic).
+    
+    Args:
+        lats: Latitudes
+        lons: Longitudes, paired with lats
+        
+    Returns:
+        Best-guess ControllerRegion per position
+    """
+    return list(map(detect_region_from_position, lats, lons))
+
+
 def inject_personality_prompt(
     base_prompt: str,
     personality: ControllerPersonality,
@@ -228,13 +267,10 @@ def inject_personality_prompt(
     Returns:
         Modified prompt with personality context
     """
-    # Find where to inject personality (after the initial role definition)
     # We'll prepend the personality prefix
-    personality_block = f"""
-=== CONTROLLER PERSONALITY: {personality.name.upper()} ===
-{personality.prompt_prefix}
-===
-"""
+    personality_block = _PERSONALITY_BLOCKS.get(personality)
+    if personality_block is None:
+        personality_block = _format_personality_block(personality)
     
     return personality_block + base_prompt
 
@@ -3,10 +3,14 @@ import re
 import logging
 from typing import List, Optional
 
-from .squawk import get_squawk_handler
+from .squawk import get_squawk_handler, EMERGENCY_CODES
 
 logger = logging.getLogger(__name__)
 
+# Patterns like "118.5", "121.500", "135.25" (band-checked after parsing).
+# Bytes pattern: ATC text is ASCII, and bytes matching skips Unicode classes.
+_FREQ_RE = re.compile(rb'\b(1[1-3]\d\.\d{1,3})\b')
+
 class CoPilot:
     """
     AI Co-pilot that parses ATC instructions and automates simulator actions.
@@ -18,6 +22,15 @@ class CoPilot:
         self.sim_data = sim_data
         self.enabled = False
         self.squawk_handler = get_squawk_handler()
+        
+        # Last transponder code seen and the emergency it maps to (if any)
+        self._last_xpdr: Optional[str] = None
+        self._cached_emergency: Optional[str] = None
+        
+        # Prefer change notifications over polling telemetry
+        self._xpdr_events = hasattr(sim_data, "add_transponder_listener")
+        if self._xpdr_events:
+            sim_data.add_transponder_listener(self._on_transponder_change)
 
     def set_enabled(self, enabled: bool):
         """Enable or disable the co-pilot automation."""
@@ -41,23 +54,27 @@ class CoPilot:
         actions_taken = []
         
         # 1. Parse Frequencies
-        # Regex looks for patterns like "118.5", "121.500", "135.25"
         # Bounded by 118.0 and 137.0 (Civil Aviation Band)
-        freq_matches = re.finditer(r'\b(1[1-3]\d\.\d{1,3})\b', text)
+        freq_matches = _FREQ_RE.finditer(text.encode('ascii', 'ignore'))
         
+        seen_freqs = set()  # kHz, so "118.5" and "118.500" are one frequency
         for match in freq_matches:
-            freq_str = match.group(1)
+            freq_str = match.group(1).decode('ascii')
             try:
                 f_val = float(freq_str)
-                # Filter for valid COMM band (118.000 - 136.975)
-                if 118.0 <= f_val < 137.0:
-                    self.sim_data.set_com1_active(freq_str)
-                    action = f"Tuned COM1 to {freq_str}"
-                    if action not in actions_taken:
-                        actions_taken.append(action)
-                        logger.info(f"Co-pilot: {action}")
             except ValueError:
                 continue
+            # Filter for valid COMM band (118.000 - 136.975)
+            if not 118.0 <= f_val < 137.0:
+                continue
+            key = int(round(f_val * 1000))
+            if key in seen_freqs:
+                continue
+            seen_freqs.add(key)
+            self.sim_data.set_com1_active(freq_str)
+            action = f"Tuned COM1 to {freq_str}"
+            actions_taken.append(action)
+            logger.info(f"Co-pilot: {action}")
 
         # 2. Parse Squawk Codes using SquawkHandler (STRATUS-006)
         squawk_code = self.squawk_handler.parse_squawk_from_atc(text)
@@ -89,16 +106,24 @@ class CoPilot:
         Returns:
             Emergency description or None if normal
         """
-        # Read current transponder from sim
+        if self._xpdr_events:
+            return self._cached_emergency
+        
+        # No change notifications: poll the sim, skipping unchanged codes
         telemetry = self.sim_data.read_telemetry()
         if telemetry and hasattr(telemetry, 'transponder'):
             code = telemetry.transponder.code
-            info = self.squawk_handler.update(code)
-            
-            if info and info.is_emergency:
-                return info.description
+            if code != self._last_xpdr:
+                self._on_transponder_change(code)
         
-        return None
+        return self._cached_emergency
+    
+    def _on_transponder_change(self, code: str):
+        """Track a new transponder code and cache its emergency status."""
+        self._last_xpdr = code
+        self.squawk_handler.update(code)
+        info = EMERGENCY_CODES.get(self.squawk_handler.current_code)
+        self._cached_emergency = info.description if info else None
 
     def get_squawk_context(self) -> str:
         """Get squawk state for ATC prompt context."""
@@ -17,6 +17,7 @@ Phases:
 
 import logging
 from enum import Enum, auto
+from time import monotonic as _mono
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
@@ -38,21 +39,57 @@ class FlightPhase(Enum):
     
     def to_atc_context(self) -> str:
         """Return phase description for ATC prompt context."""
-        return {
-            FlightPhase.UNKNOWN: "Unknown phase",
-            FlightPhase.PARKED: "Parked at gate/ramp",
-            FlightPhase.TAXI_OUT: "Taxiing for departure",
-            FlightPhase.TAKEOFF: "Takeoff roll / initial climb",
-            FlightPhase.DEPARTURE: "Departing, climbing",
-            FlightPhase.CRUISE: "Cruising at altitude",
-            FlightPhase.DESCENT: "Descending",
-            FlightPhase.APPROACH: "On approach",
-            FlightPhase.LANDING: "Landing / rollout",
-            FlightPhase.TAXI_IN: "Taxiing to parking",
-        }.get(self, "Unknown")
-
-
-@dataclass
+        return _ATC_CONTEXT[self.value - 1]
+
+
+# Per-phase tables indexed by FlightPhase.value - 1 (auto() numbers 1..N in order)
+_ATC_CONTEXT: Tuple[str, ...] = (
+    "Unknown phase",                    # UNKNOWN
+    "Parked at gate/ramp",              # PARKED
+    "Taxiing for departure",            # TAXI_OUT
+    "Takeoff roll / initial climb",     # TAKEOFF
+    "Departing, climbing",              # DEPARTURE
+    "Cruising at altitude",             # CRUISE
+    "Descending",                       # DESCENT
+    "On approach",                      # APPROACH
+    "Landing / rollout",                # LANDING
+    "Taxiing to parking",               # TAXI_IN
+)
+
+_EXPECTED_SERVICES: Tuple[Tuple[str, ...], ...] = (
+    ("Unknown",),                           # UNKNOWN
+    ("Clearance Delivery", "Ground"),       # PARKED
+    ("Ground",),                            # TAXI_OUT
+    ("Tower",),                             # TAKEOFF
+    ("Tower", "Departure"),                 # DEPARTURE
+    ("Center", "Flight Following"),         # CRUISE
+    ("Center", "Approach"),                 # DESCENT
+    ("Approach", "Tower"),                  # APPROACH
+    ("Tower",),                             # LANDING
+    ("Ground",),                            # TAXI_IN
+)
+
+# Phase decision tables for FlightPhaseTracker._detect_phase
+
+# Index: ias_band * 2 + was_airborne
+_GROUND_PHASES: Tuple[FlightPhase, ...] = (
+    FlightPhase.PARKED, FlightPhase.TAXI_IN,       # stopped (< 10 kts)
+    FlightPhase.TAXI_OUT, FlightPhase.TAXI_IN,     # taxi speed
+    FlightPhase.TAKEOFF, FlightPhase.LANDING,      # fast on ground
+)
+
+# Index: vs_band * 4 + below_departure_msl * 2 + below_pattern_agl
+_AIRBORNE_PHASES: Tuple[FlightPhase, ...] = (
+    # Descending: low = approach
+    FlightPhase.DESCENT, FlightPhase.APPROACH, FlightPhase.DESCENT, FlightPhase.APPROACH,
+    # Level: low and level - probably in pattern
+    FlightPhase.CRUISE, FlightPhase.APPROACH, FlightPhase.CRUISE, FlightPhase.APPROACH,
+    # Climbing: below departure altitude = departure, else cruise/step climb
+    FlightPhase.CRUISE, FlightPhase.CRUISE, FlightPhase.DEPARTURE, FlightPhase.DEPARTURE,
+)
+
+
+@dataclass(slots=True)
 class PhaseThresholds:
     """Configurable thresholds for phase detection."""
     # Ground detection
@@ -71,6 +108,19 @@ class PhaseThresholds:
     phase_confirm_time: float = 3.0
 
 
+_DEFAULT_THRESHOLDS = PhaseThresholds()
+
+
+def _read_state(telemetry) -> Tuple[bool, float, float, float, float]:
+    """Telemetry values phase detection depends on (on_ground, ias, vs, msl, agl)."""
+    alt_msl = telemetry.altitude_msl
+    try:
+        alt_agl = telemetry.altitude_agl
+    except AttributeError:
+        alt_agl = alt_msl  # Fallback if no AGL
+    return (telemetry.on_ground, telemetry.ias, telemetry.vertical_speed, alt_msl, alt_agl)
+
+
 class FlightPhaseTracker:
     """
     Track flight phase using state machine logic.
@@ -79,7 +129,14 @@ class FlightPhaseTracker:
     """
     
     def __init__(self, thresholds: Optional[PhaseThresholds] = None):
-        self._thresholds = thresholds or PhaseThresholds()
+        t = self._thresholds = thresholds or _DEFAULT_THRESHOLDS
+        # Unpacked for the per-tick classifier; thresholds are fixed per tracker
+        self._taxi_max = t.taxi_speed_max
+        self._climb_vs = t.climb_vs_threshold
+        self._descent_vs = t.descent_vs_threshold
+        self._pattern_agl = t.pattern_altitude_agl
+        self._departure_msl = t.departure_altitude_msl
+        self._confirm_time = t.phase_confirm_time
         self._current_phase = FlightPhase.UNKNOWN
         self._pending_phase: Optional[FlightPhase] = None
         self._phase_start_time: float = 0.0
@@ -89,6 +146,9 @@ class FlightPhaseTracker:
         self._max_altitude_reached: float = 0.0
         self._was_airborne: bool = False
         
+        # Detection inputs from the previous update (see update())
+        self._last_state: Optional[Tuple] = None
+        
     @property
     def current_phase(self) -> FlightPhase:
         return self._current_phase
@@ -110,11 +170,18 @@ class FlightPhaseTracker:
         if not telemetry or not telemetry.connected:
             return FlightPhase.UNKNOWN
         
-        import time
-        current_time = time.time()
+        current_time = _mono()
+        
+        # Same detection inputs as last tick with nothing pending: the phase
+        # (and max altitude / airborne tracking) cannot change
+        state = _read_state(telemetry)
+        if state == self._last_state and self._pending_phase is None:
+            self._last_update_time = current_time
+            return self._current_phase
+        self._last_state = state
         
         # Detect the logical phase
-        detected_phase = self._detect_phase(telemetry)
+        detected_phase = self._classify(*state)
         
         # Track max altitude for descent detection
         if telemetry.altitude_msl > self._max_altitude_reached:
@@ -129,7 +196,7 @@ class FlightPhaseTracker:
             if detected_phase == self._pending_phase:
                 # Same pending phase, check if we should confirm
                 elapsed = current_time - self._phase_start_time
-                if elapsed >= self._thresholds.phase_confirm_time:
+                if elapsed >= self._confirm_time:
                     self._transition_to(detected_phase)
             else:
                 # New pending phase
@@ -144,59 +211,37 @@ class FlightPhaseTracker:
     
     def _detect_phase(self, telemetry) -> FlightPhase:
         """Detect the logical phase based on telemetry values."""
-        on_ground = telemetry.on_ground
-        ias = telemetry.ias
-        vs = telemetry.vertical_speed
-        alt_msl = telemetry.altitude_msl
-        alt_agl = getattr(telemetry, 'altitude_agl', alt_msl)  # Fallback if no AGL
-        
-        t = self._thresholds
-        
-        # ON GROUND PHASES
+        return self._classify(*_read_state(telemetry))
+    
+    def _classify(
+        self,
+        on_ground: bool,
+        ias: float,
+        vs: float,
+        alt_msl: float,
+        alt_agl: float,
+    ) -> FlightPhase:
+        """Detect the logical phase from the values read by _read_state()."""
+        # ON GROUND PHASES: speed band x whether we've flown yet
         if on_ground:
             if ias < 10:
-                # Very slow or stopped
-                if self._was_airborne:
-                    return FlightPhase.TAXI_IN
-                else:
-                    return FlightPhase.PARKED
-            elif ias < t.taxi_speed_max:
-                # Moving slowly on ground
-                if self._was_airborne:
-                    return FlightPhase.TAXI_IN
-                else:
-                    return FlightPhase.TAXI_OUT
+                ias_band = 0    # Very slow or stopped
+            elif ias < self._taxi_max:
+                ias_band = 1    # Moving slowly on ground
             else:
-                # Fast on ground
-                if self._was_airborne:
-                    return FlightPhase.LANDING
-                else:
-                    return FlightPhase.TAKEOFF
+                ias_band = 2    # Fast on ground
+            return _GROUND_PHASES[ias_band * 2 + self._was_airborne]
         
-        # AIRBORNE PHASES
+        # AIRBORNE PHASES: vertical speed band x low (MSL) x low (AGL)
+        if vs > self._climb_vs:
+            vs_band = 2
+        elif vs < self._descent_vs:
+            vs_band = 0
         else:
-            # Check vertical speed
-            if vs > t.climb_vs_threshold:
-                # Climbing
-                if alt_msl < t.departure_altitude_msl:
-                    return FlightPhase.DEPARTURE
-                else:
-                    # Could be cruise-climb or step climb
-                    return FlightPhase.CRUISE
-                    
-            elif vs < t.descent_vs_threshold:
-                # Descending
-                if alt_agl < t.pattern_altitude_agl:
-                    return FlightPhase.APPROACH
-                else:
-                    return FlightPhase.DESCENT
-            else:
-                # Level flight
-                if alt_agl < t.pattern_altitude_agl:
-                    # Low and level - probably in pattern
-                    return FlightPhase.APPROACH
-                else:
-                    return FlightPhase.CRUISE
+            vs_band = 1
+        low_msl = alt_msl < self._departure_msl
+        low_agl = alt_agl < self._pattern_agl
+        return _AIRBORNE_PHASES[vs_band * 4 + low_msl * 2 + low_agl]
     
     def _transition_to(self, new_phase: FlightPhase):
         """Perform phase transition with logging."""
@@ -217,6 +262,7 @@ class FlightPhaseTracker:
         self._pending_phase = None
         self._max_altitude_reached = 0.0
         self._was_airborne = False
+        self._last_state = None
         logger.info("[PHASE] Tracker reset")
     
     def get_atc_context(self) -> str:
@@ -229,27 +275,13 @@ class FlightPhaseTracker:
         
         Used to guide prompt construction.
         """
-        phase_services = {
-            FlightPhase.PARKED: ["Clearance Delivery", "Ground"],
-            FlightPhase.TAXI_OUT: ["Ground"],
-            FlightPhase.TAKEOFF: ["Tower"],
-            FlightPhase.DEPARTURE: ["Tower", "Departure"],
-            FlightPhase.CRUISE: ["Center", "Flight Following"],
-            FlightPhase.DESCENT: ["Center", "Approach"],
-            FlightPhase.APPROACH: ["Approach", "Tower"],
-            FlightPhase.LANDING: ["Tower"],
-            FlightPhase.TAXI_IN: ["Ground"],
-        }
-        return phase_services.get(self._current_phase, ["Unknown"])
+        return list(_EXPECTED_SERVICES[self._current_phase.value - 1])
 
 
-# Global tracker instance
-_tracker: Optional[FlightPhaseTracker] = None
+# Global tracker instance (created at import so concurrent first calls share it)
+_tracker = FlightPhaseTracker()
 
 
 def get_flight_phase_tracker() -> FlightPhaseTracker:
     """Get the global flight phase tracker instance."""
-    global _tracker
-    if _tracker is None:
-        _tracker = FlightPhaseTracker()
     return _tracker
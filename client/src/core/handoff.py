@@ -9,10 +9,13 @@ Tracks:
 - Handoff phraseology generation
 """
 
+import functools
 import logging
 from enum import Enum, auto
-from typing import Optional, Tuple, List
-from dataclasses import dataclass
+from typing import Optional, Tuple, List, Union, Dict
+from dataclasses import dataclass, field
+
+from .flight_phase import FlightPhase
 
 logger = logging.getLogger(__name__)
 
@@ -31,35 +34,45 @@ class FacilityType(Enum):
     
     def to_name(self, identifier: str = "") -> str:
         """Get readable facility name."""
-        base_names = {
-            FacilityType.CLEARANCE: "Clearance",
-            FacilityType.GROUND: "Ground",
-            FacilityType.TOWER: "Tower",
-            FacilityType.DEPARTURE: "Departure",
-            FacilityType.APPROACH: "Approach",
-            FacilityType.CENTER: "Center",
-            FacilityType.UNICOM: "Traffic",
-            FacilityType.FLIGHT_SERVICE: "Radio",
-        }
-        name = base_names.get(self, "ATC")
+        name = _FACILITY_BASE_NAMES[self.value - 1]
         if identifier:
             return f"{identifier} {name}"
         return name
 
 
-@dataclass
+# Indexed by FacilityType.value - 1 (auto() numbers 1..N in order)
+_FACILITY_BASE_NAMES: Tuple[str, ...] = (
+    "ATC",          # UNKNOWN
+    "Clearance",    # CLEARANCE
+    "Ground",       # GROUND
+    "Tower",        # TOWER
+    "Departure",    # DEPARTURE
+    "Approach",     # APPROACH
+    "Center",       # CENTER
+    "Traffic",      # UNICOM
+    "Radio",        # FLIGHT_SERVICE
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Facility:
     """Represents an ATC facility."""
     type: FacilityType
     identifier: str         # e.g., "NorCal", "SoCal", "Oakland"
     frequency: str          # Primary frequency
+    name: str = field(init=False, repr=False, compare=False)  # Readable name
     
-    @property
-    def name(self) -> str:
-        return self.type.to_name(self.identifier)
+    def __post_init__(self):
+        object.__setattr__(self, "name", self.type.to_name(self.identifier))
 
 
-@dataclass
+@functools.lru_cache(maxsize=32)
+def _make_facility(type: FacilityType, identifier: str, frequency: str) -> Facility:
+    """Shared Facility for a (type, identifier, frequency); facilities are immutable."""
+    return Facility(type=type, identifier=identifier, frequency=frequency)
+
+
+@dataclass(slots=True)
 class HandoffTrigger:
     """Conditions that trigger a handoff."""
     altitude_above: Optional[int] = None    # Handoff when above this altitude
@@ -68,6 +81,29 @@ class HandoffTrigger:
     phase_change: Optional[str] = None      # When entering this phase
 
 
+@functools.lru_cache(maxsize=64)
+def _phase_flags(phase: str) -> Tuple[bool, bool, bool, bool]:
+    """
+    Classify a phase description for facility selection.
+    
+    Returns:
+        (ground, departing, cruising, arriving) flags
+    """
+    phase = phase.lower()
+    return (
+        "parked" in phase or "taxi" in phase,
+        "takeoff" in phase or "departure" in phase,
+        "cruise" in phase,
+        "descent" in phase or "approach" in phase,
+    )
+
+
+# Flags for every FlightPhase, keyed by both the enum member and its name
+_PHASE_FLAGS: Dict[Union[FlightPhase, str], Tuple[bool, bool, bool, bool]] = {
+    key: _phase_flags(phase.name) for phase in FlightPhase for key in (phase, phase.name)
+}
+
+
 class HandoffManager:
     """
     Manage ATC facility handoffs based on flight phase and position.
@@ -100,10 +136,12 @@ class HandoffManager:
         self._arrival_airport = icao
         logger.info(f"[HANDOFF] Arrival set: {icao}")
     
-    def update(self, telemetry, flight_phase: str) -> Optional[str]:
+    def update(self, telemetry, flight_phase: Union[FlightPhase, str]) -> Optional[str]:
         """
         Check if a handoff should occur based on current state.
         
+        flight_phase is a FlightPhase, its name, or a free-form description.
+        
         Returns handoff phraseology if handoff triggered, None otherwise.
         """
         if not telemetry or not telemetry.connected:
@@ -131,53 +169,57 @@ class HandoffManager:
     
     def _determine_expected_facility(
         self, 
-        phase: str, 
+        phase: Union[FlightPhase, str], 
         altitude: float, 
         on_ground: bool
     ) -> Optional[Facility]:
         """Determine which facility should be controlling based on phase."""
         
-        # Map phase strings to facility types
+        # Map phases to facility types
         # This is simplified - real logic would use airport data
+        flags = _PHASE_FLAGS.get(phase)
+        if flags is None:
+            flags = _phase_flags(phase)
+        ground, departing, cruising, arriving = flags
         
         if on_ground:
-            if "parked" in phase.lower() or "taxi" in phase.lower():
-                return Facility(
+            if ground:
+                return _make_facility(
                     type=FacilityType.GROUND,
                     identifier=self._departure_airport or "",
                     frequency="121.900"  # Common ground freq
                 )
         
-        if "takeoff" in phase.lower() or "departure" in phase.lower():
+        if departing:
             if altitude < 3000:
-                return Facility(
+                return _make_facility(
                     type=FacilityType.TOWER,
                     identifier=self._departure_airport or "",
                     frequency="118.300"
                 )
             elif altitude < 10000:
-                return Facility(
+                return _make_facility(
                     type=FacilityType.DEPARTURE,
                     identifier="",
                     frequency="124.000"
                 )
         
-        if "cruise" in phase.lower() or altitude > 18000:
-            return Facility(
+        if cruising or altitude > 18000:
+            return _make_facility(
                 type=FacilityType.CENTER,
                 identifier="",
                 frequency="127.750"
             )
         
-        if "descent" in phase.lower() or "approach" in phase.lower():
+        if arriving:
             if altitude > 10000:
-                return Facility(
+                return _make_facility(
                     type=FacilityType.CENTER,
                     identifier="",
                     frequency="127.750"
                 )
             else:
-                return Facility(
+                return _make_facility(
                     type=FacilityType.APPROACH,
                     identifier="",
                     frequency="124.350"
@@ -224,13 +266,10 @@ class HandoffManager:
         logger.info("[HANDOFF] Manager reset")
 
 
-# Global instance
-_manager: Optional[HandoffManager] = None
+# Global instance (created at import so concurrent first calls share it)
+_manager = HandoffManager()
 
 
 def get_handoff_manager() -> HandoffManager:
     """Get the global handoff manager instance."""
-    global _manager
-    if _manager is None:
-        _manager = HandoffManager()
     return _manager
@@ -0,0 +1,135 @@
+"""
+JSON Lines helpers for Stratus ATC
+
+Record encoding/decoding (orjson when installed, else stdlib json) and a
+background writer that appends records to a .jsonl log off the caller's
+thread. Used by the SECA and latency logs.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Parse one record from a line (bytes or str)
+decode_record = orjson.loads if HAS_ORJSON else json.loads
+
+
+def encode_record(data: dict) -> bytes:
+    """Serialize one JSONL record, newline included."""
+    if HAS_ORJSON:
+        return orjson.dumps(data) + b"\n"
+    return (json.dumps(data) + "\n").encode("utf-8")
+
+
+class JsonlWriter:
+    """
+    Appends records to a JSONL file from a single background thread.
+
+    write() only queues the record; the writer thread batches whatever has
+    piled up into one append. It is the only holder of the file handle, so
+    a rotation can't leave another handle appending to the renamed file.
+    """
+
+    BATCH_SIZE = 32
+
+    def __init__(self, path: Path, log_tag: str, max_size_mb: Optional[float] = None):
+        """
+        Args:
+            path: Log file to append to (parent directory created on first write)
+            log_tag: Prefix for this writer's log messages, e.g. "[SECA]"
+            max_size_mb: Rotate the file to .jsonl.old past this size (None: never)
+        """
+        self.path = path
+        self.records_written = 0
+        self._log_tag = log_tag
+        self._max_bytes = max_size_mb * 1024 * 1024 if max_size_mb is not None else None
+        self._size = 0  # Current file size, tracked from our own writes
+
+        self._queue: "queue.Queue[dict]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        if self._max_bytes is not None:
+            # Runs before the writer thread exists, so nothing holds the file
+            self._size = path.stat().st_size if path.exists() else 0
+            if self._size > self._max_bytes:
+                self._rotate()
+
+    def write(self, record: dict):
+        """Queue a record for appending; starts the writer thread on first use."""
+        self._queue.put(record)
+
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    thread = threading.Thread(target=self._writer_loop, daemon=True)
+                    thread.start()
+                    atexit.register(self.flush)
+                    self._thread = thread
+
+    def flush(self):
+        """Block until all queued records have been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _rotate(self):
+        """Rename the log to .old and start fresh."""
+        old_file = self.path.with_suffix(".jsonl.old")
+        if old_file.exists():
+            old_file.unlink()
+        self.path.rename(old_file)
+        logger.info(f"{self._log_tag} Rotated log file (was {self._size / (1024 * 1024):.1f}MB)")
+        self._size = 0
+
+    def _writer_loop(self):
+        """Append queued records to the log, batching whatever has piled up."""
+        f = None
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                if f is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    f = open(self.path, "ab")
+                data = b"".join(map(encode_record, batch))
+                f.write(data)
+                f.flush()
+                self.records_written += len(batch)
+
+                # Rotate on our running byte count rather than stat()ing the
+                # file (closes it first so it can be renamed)
+                self._size += len(data)
+                if self._max_bytes is not None and self._size > self._max_bytes:
+                    f.close()
+                    f = None
+                    self._rotate()
+
+            except Exception as e:
+                logger.error(f"{self._log_tag} Failed to write log: {e}")
+                if f is not None:
+                    try:
+                        f.close()
+                    except OSError:
+                        pass
+                    f = None
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
@@ -17,26 +17,48 @@ Usage:
 """
 
 import time
+from time import time as _now
+import itertools
 import logging
-import json
-import os
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+from .jsonl import JsonlWriter
 
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path.home() / ".local" / "share" / "StratusATC"
 
+# Completed measurements kept in memory for reports
+HISTORY_SIZE = 1024
+
 
-@dataclass
+@dataclass(slots=True)
 class LatencyMeasurement:
     """Single latency measurement for a transmission."""
     session_id: str
     start_time: float
-    marks: Dict[str, float] = field(default_factory=dict)
+    # Marks in the order they were taken (parallel lists, names unique)
+    mark_names: List[str] = field(default_factory=list)
+    mark_times: List[float] = field(default_factory=list)
     end_time: Optional[float] = None
     
+    @property
+    def marks(self) -> Dict[str, float]:
+        """Mark name -> timestamp."""
+        return dict(zip(self.mark_names, self.mark_times))
+    
+    def add_mark(self, name: str, mark_time: float):
+        """Record a mark; re-marking a name moves it to the end."""
+        if name in self.mark_names:
+            i = self.mark_names.index(name)
+            del self.mark_names[i]
+            del self.mark_times[i]
+        self.mark_names.append(name)
+        self.mark_times.append(mark_time)
+    
     @property
     def total_ms(self) -> Optional[float]:
         """Total end-to-end latency in milliseconds."""
@@ -46,9 +68,23 @@ class LatencyMeasurement:
     
     def get_segment_ms(self, start_mark: str, end_mark: str) -> Optional[float]:
         """Get latency between two marks in milliseconds."""
-        if start_mark not in self.marks or end_mark not in self.marks:
+        names = self.mark_names
+        if start_mark not in names or end_mark not in names:
             return None
-        return (self.marks[end_mark] - self.marks[start_mark]) * 1000
+        times = self.mark_times
+        return (times[names.index(end_mark)] - times[names.index(start_mark)]) * 1000
+    
+    def segments(self) -> List[Tuple[str, str, float]]:
+        """(from_mark, to_mark, ms) for each consecutive pair of marks, then to end."""
+        names = ["start", *self.mark_names]
+        times = [self.start_time, *self.mark_times]
+        segments = [
+            (prev_name, name, (t - prev_t) * 1000)
+            for prev_name, name, prev_t, t in zip(names, names[1:], times, times[1:])
+        ]
+        if self.end_time:
+            segments.append((names[-1], "end", (self.end_time - times[-1]) * 1000))
+        return segments
     
     def to_dict(self) -> dict:
         """Convert to dictionary for logging."""
@@ -59,19 +95,9 @@ class LatencyMeasurement:
             "end_time": self.end_time,
             "total_ms": self.total_ms,
         }
-        # Calculate segment timings
-        if self.marks:
-            segments = {}
-            prev_time = self.start_time
-            prev_name = "start"
-            for mark_name, mark_time in sorted(self.marks.items(), key=lambda x: x[1]):
-                segment_name = f"{prev_name}_to_{mark_name}"
-                segments[segment_name] = (mark_time - prev_time) * 1000
-                prev_time = mark_time
-                prev_name = mark_name
-            if self.end_time:
-                segments[f"{prev_name}_to_end"] = (self.end_time - prev_time) * 1000
-            result["segments_ms"] = segments
+        # Segment timings (marks are already in time order)
+        if self.mark_names:
+            result["segments_ms"] = self.segments()
         return result
 
 
@@ -89,25 +115,25 @@ class LatencyTracker:
     
     def __init__(self, log_to_file: bool = True):
         self._current: Optional[LatencyMeasurement] = None
-        self._history: List[LatencyMeasurement] = []
+        self._history: Deque[LatencyMeasurement] = deque(maxlen=HISTORY_SIZE)
         self._log_to_file = log_to_file
         self._session_counter = 0
         self._log_file = DATA_DIR / "latency.jsonl"
         
-        # Ensure data directory exists
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        # JSONL records are appended by a background writer, off the PTT path
+        self._writer = JsonlWriter(self._log_file, "[LATENCY]")
     
     def start(self, label: str = "ptt") -> str:
         """Start a new latency measurement. Returns session ID."""
         self._session_counter += 1
-        session_id = f"{label}_{int(time.time())}_{self._session_counter}"
+        session_id = f"{label}_{int(_now())}_{self._session_counter}"
         
         self._current = LatencyMeasurement(
             session_id=session_id,
-            start_time=time.time()
+            start_time=_now()
         )
         
-        logger.debug(f"[LATENCY] Started measurement: {session_id}")
+        logger.debug("[LATENCY] Started measurement: %s", session_id)
         return session_id
     
     def mark(self, name: str) -> Optional[float]:
@@ -125,11 +151,11 @@ class LatencyTracker:
             logger.warning(f"[LATENCY] Mark '{name}' called with no active measurement")
             return None
         
-        mark_time = time.time()
-        self._current.marks[name] = mark_time
+        mark_time = _now()
+        self._current.add_mark(name, mark_time)
         ms_since_start = (mark_time - self._current.start_time) * 1000
         
-        logger.debug(f"[LATENCY] Mark '{name}': {ms_since_start:.1f}ms since start")
+        logger.debug("[LATENCY] Mark '%s': %.1fms since start", name, ms_since_start)
         return ms_since_start
     
     def end(self) -> Optional[LatencyMeasurement]:
@@ -138,7 +164,7 @@ class LatencyTracker:
             logger.warning("[LATENCY] end() called with no active measurement")
             return None
         
-        self._current.end_time = time.time()
+        self._current.end_time = _now()
         measurement = self._current
         self._current = None
         
@@ -154,61 +180,76 @@ class LatencyTracker:
         logger.info(f"[LATENCY] Completed {measurement.session_id}: {total:.1f}ms total")
         
         # Log segment breakdown
-        if measurement.marks:
-            segments = measurement.to_dict().get("segments_ms", {})
-            for seg_name, seg_ms in segments.items():
-                logger.info(f"[LATENCY]   {seg_name}: {seg_ms:.1f}ms")
+        if measurement.mark_names:
+            for from_mark, to_mark, seg_ms in measurement.segments():
+                logger.info(f"[LATENCY]   {from_mark}_to_{to_mark}: {seg_ms:.1f}ms")
         
         return measurement
     
     def abort(self):
         """Abort current measurement without logging."""
         if self._current:
-            logger.debug(f"[LATENCY] Aborted {self._current.session_id}")
+            logger.debug("[LATENCY] Aborted %s", self._current.session_id)
         self._current = None
     
     def _write_to_file(self, measurement: LatencyMeasurement):
-        """Append measurement to JSONL log file."""
-        try:
-            with open(self._log_file, "a") as f:
-                data = measurement.to_dict()
-                data["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S")
-                f.write(json.dumps(data) + "\n")
-        except Exception as e:
-            logger.error(f"[LATENCY] Failed to write log: {e}")
+        """Queue measurement for appending to the JSONL log file."""
+        data = measurement.to_dict()
+        data["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self._writer.write(data)
+    
+    def flush(self):
+        """Block until all queued measurements have been written."""
+        self._writer.flush()
     
     def get_report(self) -> Dict:
         """Get a summary report of all measurements."""
         if not self._history:
             return {"count": 0, "message": "No measurements recorded"}
         
-        totals = [m.total_ms for m in self._history if m.total_ms is not None]
+        # One pass over history for min/max/target counts
+        totals = []
+        min_ms = max_ms = None
+        under = 0
+        for m in self._history:
+            total = m.total_ms
+            if total is None:
+                continue
+            totals.append(total)
+            if min_ms is None or total < min_ms:
+                min_ms = total
+            if max_ms is None or total > max_ms:
+                max_ms = total
+            if total < 2000:
+                under += 1
         
         if not totals:
             return {"count": len(self._history), "message": "No completed measurements"}
         
         return {
             "count": len(totals),
-            "min_ms": min(totals),
-            "max_ms": max(totals),
+            "min_ms": min_ms,
+            "max_ms": max_ms,
             "avg_ms": sum(totals) / len(totals),
             "target_ms": 2000,  # 2 second target
-            "under_target": sum(1 for t in totals if t < 2000),
-            "over_target": sum(1 for t in totals if t >= 2000),
+            "under_target": under,
+            "over_target": len(totals) - under,
         }
     
     def get_history(self, limit: int = 10) -> List[Dict]:
         """Get recent measurements as dictionaries."""
-        return [m.to_dict() for m in self._history[-limit:]]
+        if limit <= 0:
+            recent = list(self._history)[-limit:]
+        else:
+            recent = list(itertools.islice(reversed(self._history), limit))
+            recent.reverse()
+        return [m.to_dict() for m in recent]
 
 
-# Global tracker instance
-_tracker: Optional[LatencyTracker] = None
+# Global tracker instance (created at import so concurrent first calls share it)
+_tracker = LatencyTracker()
 
 
 def get_tracker() -> LatencyTracker:
     """Get the global latency tracker instance."""
-    global _tracker
-    if _tracker is None:
-        _tracker = LatencyTracker()
     return _tracker
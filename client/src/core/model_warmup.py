@@ -13,7 +13,8 @@ import logging
 import threading
 import time
 import requests
-from typing import Optional, Callable
+from requests.adapters import HTTPAdapter
+from typing import Optional, Callable, List
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,10 @@ OLLAMA_URL = "http://localhost:11434/api/generate"
 WARMUP_PROMPT = "Ready"
 WARMUP_EXPECTED = "Standing by"  # We don't check this, just keep model hot
 
+# Ask Ollama to keep the model resident this long after each heartbeat, so a
+# few skipped heartbeats (e.g. long PTT pauses) don't let it unload
+WARMUP_KEEP_ALIVE = "30m"
+
 
 class ModelWarmupService:
     """
@@ -57,6 +62,10 @@ class ModelWarmupService:
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         
+        # Reuse one keep-alive connection for every heartbeat
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0))
+        
         # Stats
         self.last_heartbeat: Optional[float] = None
         self.heartbeat_count = 0
@@ -76,6 +85,8 @@ class ModelWarmupService:
         
         self._running = True
         self._stop_event.clear()
+        # One long-lived thread parked in Event.wait(). A re-armed
+        # threading.Timer is the same kind of thread, just re-created each tick.
         self._thread = threading.Thread(target=self._warmup_loop, daemon=True)
         self._thread.start()
         logger.info("Warmup service started")
@@ -86,6 +97,7 @@ class ModelWarmupService:
         self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2.0)
+        self._session.close()
         logger.info("Warmup service stopped")
     
     def pause(self):
@@ -101,11 +113,9 @@ class ModelWarmupService:
     def _warmup_loop(self):
         """Main heartbeat loop."""
         while self._running:
-            # Wait for interval (but check stop event frequently)
-            for _ in range(int(self.interval_seconds * 10)):
-                if self._stop_event.is_set():
-                    return
-                time.sleep(0.1)
+            # Sleep for one interval; stop() wakes us immediately
+            if self._stop_event.wait(timeout=self.interval_seconds):
+                return
             
             # Skip if paused
             if self._paused:
@@ -125,7 +135,7 @@ class ModelWarmupService:
                     elif self.on_heartbeat:
                         self.on_heartbeat(latency)
                     
-                    logger.debug(f"Warmup heartbeat: {latency:.0f}ms")
+                    logger.debug("Warmup heartbeat: %.0fms", latency)
                     
             except Exception as e:
                 logger.warning(f"Warmup heartbeat failed: {e}")
@@ -137,37 +147,45 @@ class ModelWarmupService:
         Returns:
             Latency in milliseconds, or None if failed
         """
-        start = time.time()
+        return self._post({
+            "model": self.model,
+            "prompt": WARMUP_PROMPT,
+            "stream": False,
+            "keep_alive": WARMUP_KEEP_ALIVE,
+            # Minimal generation
+            "options": {
+                "num_predict": 1,  # One token is enough to exercise the model
+                "temperature": 0.0,  # Deterministic
+            }
+        })
+    
+    def _post(self, payload: dict, timeout: float = 15.0) -> Optional[float]:
+        """
+        POST a request to Ollama over the pooled session.
+        
+        Returns:
+            Latency in milliseconds, or None if failed
+        """
+        start = time.perf_counter()
         
         try:
-            response = requests.post(
-                self.ollama_url,
-                json={
-                    "model": self.model,
-                    "prompt": WARMUP_PROMPT,
-                    "stream": False,
-                    # Minimal generation
-                    "options": {
-                        "num_predict": 5,  # Only generate a few tokens
-                        "temperature": 0.0,  # Deterministic
-                    }
-                },
-                timeout=15.0,
-            )
-            response.raise_for_status()
-            
-            latency_ms = (time.time() - start) * 1000
-            return latency_ms
-            
+            response = self._session.post(self.ollama_url, json=payload, timeout=timeout)
         except requests.exceptions.ConnectionError:
             logger.debug("Ollama not running, skipping warmup")
             return None
         except requests.exceptions.Timeout:
             logger.warning("Warmup timed out (model might need initial load)")
             return None
-        except Exception as e:
+        except requests.exceptions.RequestException as e:
             logger.warning(f"Warmup error: {e}")
             return None
+        
+        if response.status_code >= 400:
+            logger.warning(f"Warmup error: HTTP {response.status_code} from {self.ollama_url}")
+            return None
+        
+        latency_ms = (time.perf_counter() - start) * 1000
+        return latency_ms
     
     def force_warmup(self) -> float:
         """
@@ -206,8 +224,53 @@ class ModelWarmupService:
         return self._paused
 
 
+class MultiModelWarmup(ModelWarmupService):
+    """
+    Keeps several Ollama models loaded from a single heartbeat thread.
+    
+    Each tick asks Ollama to load every registered model with an empty
+    prompt (no generation), one after another over the same keep-alive
+    connection, instead of running one ModelWarmupService per model.
+    """
+    
+    def __init__(
+        self,
+        models: Optional[List[str]] = None,
+        interval_seconds: float = 30.0,
+        ollama_url: str = OLLAMA_URL,
+    ):
+        self.models: List[str] = list(models or [])
+        super().__init__(
+            model=", ".join(self.models),
+            interval_seconds=interval_seconds,
+            ollama_url=ollama_url,
+        )
+    
+    def register(self, model: str):
+        """Add a model to keep warm (no-op if already registered)."""
+        if model not in self.models:
+            self.models.append(model)
+            self.model = ", ".join(self.models)
+            logger.info(f"Warmup registered model: {model}")
+    
+    def _send_heartbeat(self) -> Optional[float]:
+        """
+        Load every registered model without generating.
+        
+        Returns:
+            Slowest per-model latency in milliseconds, or None if all failed
+        """
+        slowest: Optional[float] = None
+        for model in list(self.models):
+            latency = self._post({"model": model, "prompt": "", "keep_alive": WARMUP_KEEP_ALIVE}, timeout=5.0)
+            if latency is not None and (slowest is None or latency > slowest):
+                slowest = latency
+        return slowest
+
+
 # Global singleton for easy access
 _warmup_service: Optional[ModelWarmupService] = None
+_multi_warmup: Optional[MultiModelWarmup] = None
 
 
 def get_warmup_service() -> ModelWarmupService:
@@ -218,6 +281,14 @@ def get_warmup_service() -> ModelWarmupService:
     return _warmup_service
 
 
+def get_multi_warmup() -> MultiModelWarmup:
+    """Get the global multi-model warmup singleton."""
+    global _multi_warmup
+    if _multi_warmup is None:
+        _multi_warmup = MultiModelWarmup()
+    return _multi_warmup
+
+
 def start_warmup(model: str = "llama3.2:3b", interval: float = 30.0):
     """Convenience function to start warmup service."""
     service = get_warmup_service()
@@ -1,5 +1,3 @@
-import configparser
-import os
 from .base import IATCProvider
 from .local import LocalSpeechProvider
 
@@ -9,6 +7,10 @@ def get_provider(config_path: str = "config.ini") -> IATCProvider:
     Factory function to return the configured ATC provider.
     
     Currently only the local provider (Ollama + speechd-ng) is supported.
+    
+    No config is read, so there is nothing to cache. Each call returns a
+    fresh provider: the UI builds a new one per connect attempt and must
+    not inherit a previous attempt's D-Bus proxy or connected state.
     """
     # Config is reserved for future provider options
     return LocalSpeechProvider()
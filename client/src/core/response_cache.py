@@ -8,15 +8,23 @@ Sub-200ms response for common exchanges.
 """
 
 import logging
+import re
 import threading
 import time
-import hashlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, List, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Closes every pre-generation prompt, after the intent description
+PROMPT_SUFFIX = "\n\nRespond with proper ATC phraseology. Be brief and realistic."
+
+# Concurrent background generations (one phase has at most a handful of intents)
+GENERATION_WORKERS = 4
+
 
 class FlightPhase(Enum):
     """Current phase of flight."""
@@ -32,15 +40,16 @@ class FlightPhase(Enum):
     TAXI_IN = "taxi_in"
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedResponse:
     """A pre-generated response in cache."""
     intent_key: str              # Unique key for this intent
     prompt_template: str         # Template used for generation
     response_text: str           # Pre-generated response
     flight_phase: FlightPhase    # Phase this applies to
-    context_hash: str            # Hash of context when generated
+    context_hash: tuple          # Context key when generated
     generated_at: float          # Timestamp
+    expires_at: float            # time.monotonic() deadline (generation + TTL)
     hit_count: int = 0           # Usage counter
 
 
@@ -117,6 +126,46 @@ PHASE_INTENTS: Dict[FlightPhase, List[Tuple[str, str]]] = {
 }
 
 
+# Keywords that map a pilot message to a cached intent, checked in order.
+# Plain substring tests; a combined alternation regex measured slower and
+# can't report overlapping keywords (e.g. "clear" inside "clearance").
+INTENT_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "request_taxi": ("taxi", "clearance", "ground"),
+    "ready_for_departure": ("ready", "departure", "takeoff"),
+    "hold_short_readback": ("hold short", "holding short"),
+    "request_flight_following": ("flight following", "vfr", "advisories"),
+    "position_report": ("position", "over", "reporting"),
+    "airport_in_sight": ("airport in sight", "field in sight"),
+    "clear_of_runway": ("clear", "runway", "off the runway"),
+    "radio_check": ("radio check", "how do you read"),
+}
+
+# Fallback for misheard speech ("raido check", "flite following"): an intent
+# matches if the Dice similarity of character trigrams between one keyword
+# and a run of as many message words reaches this threshold. Short keywords
+# only match exactly - "positive" scores 0.62 against "position" and
+# "going around" shares most of the trigrams of "ground".
+FUZZY_THRESHOLD = 0.6
+_MIN_FUZZY_KEYWORD = 9
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def _qgrams(text: str) -> frozenset:
+    """Character trigrams of text, padded so word edges count."""
+    text = f" {text} "
+    return frozenset(map("".join, zip(text, text[1:], text[2:])))
+
+
+# (intent_key, ((keyword word count, keyword trigrams), ...)) per intent
+_INTENT_QGRAMS: Tuple[Tuple[str, Tuple[Tuple[int, frozenset], ...]], ...] = tuple(
+    (intent_key, tuple(
+        (len(kw.split()), _qgrams(kw)) for kw in keywords if len(kw) >= _MIN_FUZZY_KEYWORD
+    ))
+    for intent_key, keywords in INTENT_KEYWORDS.items()
+)
+
+
 class SpeculativeCache:
     """
     Cache for pre-generated ATC responses.
@@ -143,14 +192,16 @@ class SpeculativeCache:
         self.max_cache_size = max_cache_size
         self.ttl_seconds = ttl_seconds
         
-        self._cache: Dict[str, CachedResponse] = {}
+        # Least recently generated/hit first, so trimming pops from the front
+        self._cache: "OrderedDict[str, CachedResponse]" = OrderedDict()
         self._stats = CacheStats()
         self._lock = threading.Lock()
-        self._current_context_hash: str = ""
+        self._current_context_hash: tuple = ()
         
-        # Background generation thread
-        self._generation_queue: List[Tuple[str, str, FlightPhase]] = []
-        self._generation_thread: Optional[threading.Thread] = None
+        # Background generation: LLM calls are I/O bound, so a phase's
+        # intents are generated concurrently rather than one after another
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
         self._running = False
         
         logger.info(f"SpeculativeCache initialized: max_size={max_cache_size}, ttl={ttl_seconds}s")
@@ -158,14 +209,15 @@ class SpeculativeCache:
     def start(self):
         """Start background generation."""
         self._running = True
-        self._generation_thread = threading.Thread(target=self._generation_loop, daemon=True)
-        self._generation_thread.start()
+        self._pool = ThreadPoolExecutor(max_workers=GENERATION_WORKERS, thread_name_prefix="specgen")
     
     def stop(self):
         """Stop background generation."""
         self._running = False
-        if self._generation_thread:
-            self._generation_thread.join(timeout=2.0)
+        if self._pool:
+            # Don't wait on in-flight LLM calls; drop anything not yet started
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
     
     def update_context(
         self,
@@ -185,9 +237,8 @@ class SpeculativeCache:
             callsign: Aircraft callsign
             frequency: Current frequency
         """
-        # Build context hash
-        context_str = f"{phase.value}|{airport}|{runway}|{callsign}|{frequency}"
-        new_hash = hashlib.md5(context_str.encode()).hexdigest()[:8]
+        # Context key (only ever compared for equality, so no hashing needed)
+        new_hash = (phase.value, airport, runway, callsign, frequency)
         
         if new_hash != self._current_context_hash:
             logger.info(f"Context changed, invalidating cache: {new_hash}")
@@ -207,67 +258,83 @@ class SpeculativeCache:
     ):
         """Queue generation of likely responses for current phase."""
         intents = PHASE_INTENTS.get(phase, [])
+        pool = self._pool
+        if pool is None:
+            logger.debug("Generation not started, skipping phase %s", phase.value)
+            return
         
+        # Generations for the previous context are stale now
+        for future in self._pending:
+            future.cancel()
+        self._pending = []
+        
+        # Only the intent line differs between this phase's prompts
+        prefix = self._build_prompt_prefix(airport, runway, callsign, frequency)
+        context_hash = self._current_context_hash
         for intent_key, intent_description in intents:
-            prompt = self._build_prompt(
-                intent_description,
-                airport=airport,
-                runway=runway,
-                callsign=callsign,
-                frequency=frequency,
-            )
-            self._generation_queue.append((intent_key, prompt, phase))
+            prompt = prefix + intent_description + PROMPT_SUFFIX
+            self._pending.append(pool.submit(
+                self._generate_and_cache, intent_key, prompt, phase, context_hash
+            ))
         
-        logger.debug(f"Queued {len(intents)} generations for phase {phase.value}")
+        logger.debug("Queued %d generations for phase %s", len(intents), phase.value)
     
-    def _build_prompt(
+    def _build_prompt_prefix(
         self,
-        intent: str,
         airport: str,
         runway: str,
         callsign: str,
         frequency: str,
     ) -> str:
-        """Build a prompt for pre-generation."""
+        """Build the context part of a pre-generation prompt (intent follows)."""
         return f"""You are ATC at {airport}. Active runway is {runway}.
         
 The pilot ({callsign}) on frequency {frequency} makes this request:
-{intent}
-
-Respond with proper ATC phraseology. Be brief and realistic."""
-    
-    def _generation_loop(self):
-        """Background loop for generating responses."""
-        while self._running:
-            if self._generation_queue:
-                try:
-                    intent_key, prompt, phase = self._generation_queue.pop(0)
-                    self._generate_and_cache(intent_key, prompt, phase)
-                except Exception as e:
-                    logger.error(f"Generation error: {e}")
-            else:
-                time.sleep(0.5)
+"""
     
-    def _generate_and_cache(self, intent_key: str, prompt: str, phase: FlightPhase):
-        """Generate and cache a response."""
+    def _generate_and_cache(
+        self,
+        intent_key: str,
+        prompt: str,
+        phase: FlightPhase,
+        context_hash: tuple,
+    ):
+        """
+        Generate and cache a response.
+        
+        Args:
+            intent_key: Intent to cache the response under
+            prompt: Generation prompt
+            phase: Flight phase the prompt was built for
+            context_hash: Context key when the generation was queued
+        """
         try:
             response = self.generate_func(prompt)
             if response:
+                # Build the entry first; the lock only covers the dict update
+                entry = CachedResponse(
+                    intent_key=intent_key,
+                    prompt_template=prompt,
+                    response_text=response,
+                    flight_phase=phase,
+                    context_hash=context_hash,
+                    generated_at=time.time(),
+                    expires_at=time.monotonic() + self.ttl_seconds,
+                )
                 with self._lock:
-                    self._cache[intent_key] = CachedResponse(
-                        intent_key=intent_key,
-                        prompt_template=prompt,
-                        response_text=response,
-                        flight_phase=phase,
-                        context_hash=self._current_context_hash,
-                        generated_at=time.time(),
-                    )
+                    # A generation already running can't be cancelled when
+                    # the context changes; drop its result instead
+                    if context_hash != self._current_context_hash:
+                        logger.debug("Dropped stale response for intent: %s", intent_key)
+                        return
+                    self._cache[intent_key] = entry
+                    self._cache.move_to_end(intent_key)
                     self._stats.generations += 1
                     
                     # Trim cache if too large
                     self._trim_cache()
                     
-                logger.debug(f"Cached response for intent: {intent_key}")
+                logger.debug("Cached response for intent: %s", intent_key)
                 
         except Exception as e:
             logger.error(f"Failed to generate for {intent_key}: {e}")
@@ -282,6 +349,7 @@ Respond with proper ATC phraseology. Be brief and realistic."""
         Returns:
             Cached response text, or None if not found
         """
+        now = time.monotonic()
         with self._lock:
             entry = self._cache.get(intent_key)
             
@@ -290,8 +358,7 @@ Respond with proper ATC phraseology. Be brief and realistic."""
                 return None
             
             # Check TTL
-            age = time.time() - entry.generated_at
-            if age > self.ttl_seconds:
+            if now > entry.expires_at:
                 del self._cache[intent_key]
                 self._stats.misses += 1
                 return None
@@ -302,40 +369,76 @@ Respond with proper ATC phraseology. Be brief and realistic."""
                 return None
             
             entry.hit_count += 1
+            self._cache.move_to_end(intent_key)
             self._stats.hits += 1
-            
-            logger.info(f"Cache HIT for {intent_key} (latency: ~0ms)")
-            return entry.response_text
+            text = entry.response_text
+        
+        # Log outside the lock so formatting doesn't hold up other threads
+        logger.info(f"Cache HIT for {intent_key} (latency: ~0ms)")
+        return text
     
-    def fuzzy_match(self, pilot_message: str) -> Optional[Tuple[str, str]]:
+    def fuzzy_match(
+        self,
+        pilot_message: str,
+        message_lower: Optional[str] = None,
+    ) -> Optional[Tuple[str, str]]:
         """
         Attempt to fuzzy match pilot message to cached intent.
         
         Args:
             pilot_message: What the pilot said
+            message_lower: pilot_message.lower(), if the caller already has it
             
         Returns:
             (intent_key, response) tuple if matched, else None
         """
-        message_lower = pilot_message.lower()
+        if message_lower is None:
+            message_lower = pilot_message.lower()
+        tried = set()
         
         # Simple keyword matching - could be enhanced with embeddings
-        keywords_map = {
-            "request_taxi": ["taxi", "clearance", "ground"],
-            "ready_for_departure": ["ready", "departure", "takeoff"],
-            "hold_short_readback": ["hold short", "holding short"],
-            "request_flight_following": ["flight following", "vfr", "advisories"],
-            "position_report": ["position", "over", "reporting"],
-            "airport_in_sight": ["airport in sight", "field in sight"],
-            "clear_of_runway": ["clear", "runway", "off the runway"],
-            "radio_check": ["radio check", "how do you read"],
-        }
+        for intent_key, keywords in INTENT_KEYWORDS.items():
+            for kw in keywords:
+                if kw in message_lower:
+                    response = self.get(intent_key)
+                    if response:
+                        return (intent_key, response)
+                    tried.add(intent_key)
+                    break
+        
+        # No exact keyword: score trigram overlap to tolerate misrecognition
+        words = _WORD_RE.findall(message_lower)
+        if not words:
+            return None
+        
+        # Trigrams of each run of n consecutive words, built once per n
+        window_grams: Dict[int, List[frozenset]] = {}
+        candidates = []
+        for intent_key, keyword_grams in _INTENT_QGRAMS:
+            if intent_key in tried:
+                continue
+            best = 0.0
+            for n_words, grams in keyword_grams:
+                windows = window_grams.get(n_words)
+                if windows is None:
+                    windows = window_grams[n_words] = [
+                        _qgrams(" ".join(words[i:i + n_words]))
+                        for i in range(len(words) - n_words + 1)
+                    ]
+                for window in windows:
+                    score = 2 * len(grams & window) / (len(grams) + len(window))
+                    if score > best:
+                        best = score
+            if best >= FUZZY_THRESHOLD:
+                candidates.append((best, intent_key))
         
-        for intent_key, keywords in keywords_map.items():
-            if any(kw in message_lower for kw in keywords):
-                response = self.get(intent_key)
-                if response:
-                    return (intent_key, response)
+        # Highest score first; ties keep INTENT_KEYWORDS order (stable sort)
+        candidates.sort(key=lambda c: c[0], reverse=True)
+        for _, intent_key in candidates:
+            response = self.get(intent_key)
+            if response:
+                logger.debug("Fuzzy matched '%s' to %s", pilot_message, intent_key)
+                return (intent_key, response)
         
         return None
     
@@ -345,22 +448,12 @@ Respond with proper ATC phraseology. Be brief and realistic."""
             count = len(self._cache)
             self._cache.clear()
             self._stats.invalidations += 1
-            logger.debug(f"Cache invalidated, cleared {count} entries")
+            logger.debug("Cache invalidated, cleared %d entries", count)
     
     def _trim_cache(self):
-        """Remove oldest entries if cache exceeds max size."""
-        if len(self._cache) <= self.max_cache_size:
-            return
-        
-        # Sort by generated_at and remove oldest
-        sorted_entries = sorted(
-            self._cache.items(),
-            key=lambda x: x[1].generated_at,
-        )
-        
-        to_remove = len(self._cache) - self.max_cache_size
-        for intent_key, _ in sorted_entries[:to_remove]:
-            del self._cache[intent_key]
+        """Remove least recently used entries if cache exceeds max size."""
+        while len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
     
     def get_stats(self) -> CacheStats:
         """Get cache statistics."""
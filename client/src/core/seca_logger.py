@@ -13,13 +13,16 @@ Stores:
 Log file: ~/.local/share/StratusATC/atc_responses.jsonl
 """
 
+import functools
 import json
 import logging
 import time
 import hashlib
 from pathlib import Path
 from typing import Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+from .jsonl import JsonlWriter, decode_record
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +31,13 @@ LOG_FILE = DATA_DIR / "atc_responses.jsonl"
 MAX_LOG_SIZE_MB = 100
 
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _prompt_digest(prompt: str) -> str:
+    """Truncated SHA256 of a prompt (memoized: the same prompt is often re-logged)."""
+    return hashlib.sha256(prompt.encode()).hexdigest()[:16]
+
+
+@dataclass(slots=True)
 class SECALogEntry:
     """Single entry in the SECA audit log."""
     timestamp: str
@@ -42,7 +51,19 @@ class SECALogEntry:
     session_id: str = ""
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Built by hand: asdict() introspects fields and deep-copies each value.
+        # validation_issues is still copied since the entry is written later.
+        return {
+            "timestamp": self.timestamp,
+            "prompt_hash": self.prompt_hash,
+            "response": self.response,
+            "response_length": self.response_length,
+            "validation_valid": self.validation_valid,
+            "validation_issues": list(self.validation_issues),
+            "latency_ms": self.latency_ms,
+            "model_id": self.model_id,
+            "session_id": self.session_id,
+        }
 
 
 class SECALogger:
@@ -55,25 +76,10 @@ class SECALogger:
     def __init__(self, enabled: bool = True):
         self._enabled = enabled
         self._log_file = LOG_FILE
-        self._entry_count = 0
         
-        # Ensure directory exists
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
-        
-        # Check for rotation
-        self._check_rotation()
-    
-    def _check_rotation(self):
-        """Rotate log if it exceeds max size."""
-        if self._log_file.exists():
-            size_mb = self._log_file.stat().st_size / (1024 * 1024)
-            if size_mb > MAX_LOG_SIZE_MB:
-                # Rotate: rename to .old and start fresh
-                old_file = self._log_file.with_suffix(".jsonl.old")
-                if old_file.exists():
-                    old_file.unlink()
-                self._log_file.rename(old_file)
-                logger.info(f"[SECA] Rotated log file (was {size_mb:.1f}MB)")
+        # Entries are appended by a background writer so logging never
+        # blocks the response path on file I/O (rotates on open if oversized)
+        self._writer = JsonlWriter(self._log_file, "[SECA]", max_size_mb=MAX_LOG_SIZE_MB)
     
     def log_response(
         self,
@@ -112,50 +118,60 @@ class SECALogger:
             session_id=session_id
         )
         
-        try:
-            with open(self._log_file, "a") as f:
-                f.write(json.dumps(entry.to_dict()) + "\n")
-            self._entry_count += 1
-            
-            # Periodic rotation check
-            if self._entry_count % 100 == 0:
-                self._check_rotation()
-                
-        except Exception as e:
-            logger.error(f"[SECA] Failed to write log: {e}")
+        self._writer.write(entry.to_dict())
+    
+    def flush(self):
+        """Block until all queued entries have been written."""
+        self._writer.flush()
     
     def _hash_prompt(self, prompt: str) -> str:
         """Hash prompt for privacy-preserving logging."""
-        return hashlib.sha256(prompt.encode()).hexdigest()[:16]
+        return _prompt_digest(prompt)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics from the log file for analysis."""
+        self.flush()
         if not self._log_file.exists():
             return {"entries": 0, "message": "No log file found"}
         
         try:
-            entries = []
-            with open(self._log_file, "r") as f:
+            # Single streaming pass; the log can approach MAX_LOG_SIZE_MB.
+            # Buffered binary line iteration already skips decoding, and
+            # parsing dominates: an mmap + readline/find() scan measured no
+            # faster here, so the plain file iterator stays.
+            count = valid_count = latency_count = 0
+            latency_sum = 0.0
+            latency_min = latency_max = None
+            with open(self._log_file, "rb") as f:
                 for line in f:
                     try:
-                        entries.append(json.loads(line))
+                        e = decode_record(line)
                     except json.JSONDecodeError:
                         continue
+                    
+                    count += 1
+                    if e.get("validation_valid", True):
+                        valid_count += 1
+                    latency = e.get("latency_ms")
+                    if latency:
+                        latency_count += 1
+                        latency_sum += latency
+                        if latency_min is None or latency < latency_min:
+                            latency_min = latency
+                        if latency_max is None or latency > latency_max:
+                            latency_max = latency
             
-            if not entries:
+            if not count:
                 return {"entries": 0, "message": "No entries in log"}
             
-            valid_count = sum(1 for e in entries if e.get("validation_valid", True))
-            latencies = [e["latency_ms"] for e in entries if e.get("latency_ms")]
-            
             return {
-                "entries": len(entries),
+                "entries": count,
                 "valid_responses": valid_count,
-                "invalid_responses": len(entries) - valid_count,
-                "validation_rate": valid_count / len(entries) if entries else 0,
-                "avg_latency_ms": sum(latencies) / len(latencies) if latencies else None,
-                "max_latency_ms": max(latencies) if latencies else None,
-                "min_latency_ms": min(latencies) if latencies else None,
+                "invalid_responses": count - valid_count,
+                "validation_rate": valid_count / count,
+                "avg_latency_ms": latency_sum / latency_count if latency_count else None,
+                "max_latency_ms": latency_max,
+                "min_latency_ms": latency_min,
                 "log_file": str(self._log_file),
             }
         except Exception as e:
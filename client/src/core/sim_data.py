@@ -13,7 +13,7 @@ import json
 import logging
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime
 import time
 
@@ -99,6 +99,7 @@ class SimDataInterface:
         
         self._last_telemetry: Optional[SimTelemetry] = None
         self._pending_commands: List[Dict[str, Any]] = []
+        self._transponder_listeners: List[Callable[[str], None]] = []
         
         logger.info(f"SimDataInterface initialized. Data dir: {self.data_dir}")
     
@@ -126,6 +127,15 @@ class SimDataInterface:
         except Exception as e:
             logger.error(f"Error writing comms display: {e}")
     
+    def add_transponder_listener(self, callback: Callable[[str], None]):
+        """
+        Register a callback for transponder code changes.
+        
+        Called with the new code whenever read_telemetry() sees a code that
+        differs from the previous successful read.
+        """
+        self._transponder_listeners.append(callback)
+    
     def read_telemetry(self) -> SimTelemetry:
         """
         Read current telemetry from the simulator.
@@ -134,6 +144,7 @@ class SimDataInterface:
             SimTelemetry object with current state
         """
         telemetry = SimTelemetry()
+        changed_code: Optional[str] = None
         
         if not self.telemetry_file.exists():
             telemetry.connected = False
@@ -200,6 +211,9 @@ class SimDataInterface:
             telemetry.tail_number = data.get("tail_number", "UNKNOWN")
             telemetry.icao_type = data.get("icao_type", "C172")
             
+            previous = self._last_telemetry
+            if previous is None or previous.transponder.code != telemetry.transponder.code:
+                changed_code = telemetry.transponder.code
             self._last_telemetry = telemetry
             
         except json.JSONDecodeError as e:
@@ -211,6 +225,13 @@ class SimDataInterface:
             telemetry.connected = False
             telemetry.stale = True
         
+        if changed_code is not None:
+            for callback in self._transponder_listeners:
+                try:
+                    callback(changed_code)
+                except Exception as e:
+                    logger.error(f"Transponder listener failed: {e}")
+        
         return telemetry
     
     @property
@@ -245,7 +266,7 @@ class SimDataInterface:
             with open(self.commands_file, 'w') as f:
                 json.dump(command_data, f, indent=2)
             
-            logger.debug(f"Sent {len(self._pending_commands)} commands to sim")
+            logger.debug("Sent %d commands to sim", len(self._pending_commands))
             self._pending_commands.clear()
             
         except Exception as e:
@@ -119,7 +119,7 @@ def install_plugin(xplane_path: Path) -> bool:
             
             if src_file.exists():
                 shutil.copy2(src_file, dst_file)
-                logger.debug(f"Installed {filename} to {dst_file}")
+                logger.debug("Installed %s to %s", filename, dst_file)
             else:
                 logger.error(f"Source file not found: {src_file}")
                 return False
@@ -14,11 +14,24 @@ Special Codes:
 import re
 import logging
 from enum import Enum, auto
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+_OCTAL_DIGITS = "01234567"
+_NON_OCTAL_RE = re.compile(r"[^0-7]")
+_SQUAWK_NUMERIC_RE = re.compile(r"squawk\s+(\d{4})")
+_SPOKEN_DIGIT = r"(zero|one|two|three|four|five|six|seven|oh)"
+_SQUAWK_SPOKEN_RE = re.compile(
+    r"squawk\s+" + r"[\s-]*".join([_SPOKEN_DIGIT] * 4)
+)
+_WORD_TO_DIGIT = {
+    "zero": "0", "oh": "0",
+    "one": "1", "two": "2", "three": "3", "four": "4",
+    "five": "5", "six": "6", "seven": "7"
+}
+
 
 class SquawkType(Enum):
     """Classification of transponder codes."""
@@ -30,7 +43,7 @@ class SquawkType(Enum):
     EMERGENCY = auto()   # 7700
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SquawkInfo:
     """Information about a squawk code."""
     code: str
@@ -83,6 +96,17 @@ SPECIAL_CODES = {
     ),
 }
 
+# Every special code, so lookups take a single .get()
+_ALL_CODES: Dict[str, SquawkInfo] = {**EMERGENCY_CODES, **SPECIAL_CODES}
+
+# ATC acknowledgement of an emergency squawk, formatted with the callsign
+_EMERGENCY_RESPONSES: Dict[str, str] = {
+    "7700": "{callsign}, I see you squawking emergency. Say nature of emergency.",
+    "7600": "{callsign}, if you read, squawk ident. No voice communication required.",
+    # 7500 - ATC will acknowledge without alerting hijacker
+    "7500": "{callsign}, roger, squawk confirmed.",
+}
+
 
 class SquawkHandler:
     """
@@ -100,7 +124,8 @@ class SquawkHandler:
     
     @property
     def is_emergency(self) -> bool:
-        return self._current_code in EMERGENCY_CODES
+        info = _ALL_CODES.get(self._current_code)
+        return info is not None and info.is_emergency
     
     def update(self, code: str) -> Optional[SquawkInfo]:
         """
@@ -117,17 +142,13 @@ class SquawkHandler:
         old_code = self._current_code
         self._current_code = code
         
-        # Check for emergency codes
-        if code in EMERGENCY_CODES:
-            info = EMERGENCY_CODES[code]
-            self._last_emergency = info
-            logger.warning(f"[SQUAWK] Emergency code activated: {code} ({info.description})")
-            return info
-        
-        # Check for special codes
-        if code in SPECIAL_CODES:
-            info = SPECIAL_CODES[code]
-            logger.info(f"[SQUAWK] Special code set: {code} ({info.description})")
+        info = _ALL_CODES.get(code)
+        if info is not None:
+            if info.is_emergency:
+                self._last_emergency = info
+                logger.warning(f"[SQUAWK] Emergency code activated: {code} ({info.description})")
+            else:
+                logger.info(f"[SQUAWK] Special code set: {code} ({info.description})")
             return info
         
         # Normal code
@@ -136,8 +157,10 @@ class SquawkHandler:
     
     def _normalize_code(self, code: str) -> str:
         """Normalize squawk code to 4-digit string."""
-        # Extract digits only
-        digits = re.sub(r"[^0-7]", "", str(code))
+        # Extract digits only (str.strip() leaves nothing if all are octal)
+        digits = str(code)
+        if digits.strip(_OCTAL_DIGITS):
+            digits = _NON_OCTAL_RE.sub("", digits)
         
         # Pad to 4 digits
         return digits.zfill(4)[:4]
@@ -156,11 +179,10 @@ class SquawkHandler:
         if len(code) != 4:
             return False, f"Squawk must be 4 digits, got {len(code)}"
         
-        if not code.isdigit():
-            return False, "Squawk must be numeric"
-        
-        # Check for invalid octal digits (8, 9)
-        if any(d in code for d in "89"):
+        # One C-level pass: anything left after stripping octal digits is invalid
+        if code.strip(_OCTAL_DIGITS):
+            if not code.isdigit():
+                return False, "Squawk must be numeric"
             return False, "Squawk codes are octal (0-7 only)"
         
         return True, ""
@@ -184,17 +206,12 @@ class SquawkHandler:
         
         Used when we need to acknowledge an emergency squawk.
         """
-        if self._current_code == "7700":
-            return f"{pilot_callsign}, I see you squawking emergency. Say nature of emergency."
-        elif self._current_code == "7600":
-            return f"{pilot_callsign}, if you read, squawk ident. No voice communication required."
-        elif self._current_code == "7500":
-            # 7500 - ATC will acknowledge without alerting hijacker
-            return f"{pilot_callsign}, roger, squawk confirmed."
-        
-        return None
+        template = _EMERGENCY_RESPONSES.get(self._current_code)
+        if template is None:
+            return None
+        return template.format(callsign=pilot_callsign)
     
-    def parse_squawk_from_atc(self, atc_message: str) -> Optional[str]:
+    def parse_squawk_from_atc(self, atc_message: str, message_lower: Optional[str] = None) -> Optional[str]:
         """
         Parse a squawk code from an ATC instruction.
         
@@ -202,8 +219,16 @@ class SquawkHandler:
             "Squawk 4512" → "4512"
             "Squawk VFR" → "1200"
             "Squawk seven-six-zero-zero" → "7600"
+        
+        message_lower may be passed if the caller has already lowercased
+        atc_message for its own parsing.
         """
-        message_lower = atc_message.lower()
+        if message_lower is None:
+            message_lower = atc_message.lower()
+        
+        # Most transmissions don't mention a squawk at all
+        if "squawk" not in message_lower:
+            return None
         
         # Check for VFR
         if "squawk vfr" in message_lower:
@@ -214,34 +239,25 @@ class SquawkHandler:
             return None  # Just ident, no code change
         
         # Look for numeric code
-        match = re.search(r"squawk\s+(\d{4})", message_lower)
+        match = _SQUAWK_NUMERIC_RE.search(message_lower)
         if match:
             return match.group(1)
         
         # Look for spoken digits (e.g., "four five one two")
-        spoken_pattern = r"squawk\s+(zero|one|two|three|four|five|six|seven|oh)[\s-]*(zero|one|two|three|four|five|six|seven|oh)[\s-]*(zero|one|two|three|four|five|six|seven|oh)[\s-]*(zero|one|two|three|four|five|six|seven|oh)"
-        match = re.search(spoken_pattern, message_lower)
+        match = _SQUAWK_SPOKEN_RE.search(message_lower)
         if match:
-            word_to_digit = {
-                "zero": "0", "oh": "0",
-                "one": "1", "two": "2", "three": "3", "four": "4",
-                "five": "5", "six": "6", "seven": "7"
-            }
-            code = "".join(word_to_digit.get(w, "0") for w in match.groups())
-            return code
+            return "".join([_WORD_TO_DIGIT[w] for w in match.groups()])
         
         return None
     
     def get_atc_context(self) -> str:
         """Get squawk state for ATC prompt context."""
-        if self._current_code in EMERGENCY_CODES:
-            info = EMERGENCY_CODES[self._current_code]
-            return f"TRANSPONDER: {self._current_code} - ⚠️ {info.description.upper()}"
-        elif self._current_code in SPECIAL_CODES:
-            info = SPECIAL_CODES[self._current_code]
-            return f"TRANSPONDER: {self._current_code} ({info.description})"
-        else:
+        info = _ALL_CODES.get(self._current_code)
+        if info is None:
             return f"TRANSPONDER: {self._current_code}"
+        if info.is_emergency:
+            return f"TRANSPONDER: {self._current_code} - ⚠️ {info.description.upper()}"
+        return f"TRANSPONDER: {self._current_code} ({info.description})"
 
 
 # Global handler instance
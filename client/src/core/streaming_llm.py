@@ -11,20 +11,33 @@ while the LLM is still generating.
 
 import logging
 import threading
-import queue
-import re
 import time
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Optional, Callable, Generator
 from dataclasses import dataclass
 
+from .jsonl import decode_record
+from .validation import validate_atc_response, get_fallback_response, sanitize_for_tts
+
 logger = logging.getLogger(__name__)
 
 # Default Ollama endpoint
 OLLAMA_URL = "http://localhost:11434/api/generate"
 
-# Phrase boundary patterns
-PHRASE_BOUNDARIES = re.compile(r'[.!?,;:\n]')
+# Phrase boundary characters
+PHRASE_BOUNDARIES = frozenset(".!?,;:\n")
+
+# How long a successful availability probe is trusted
+AVAILABILITY_TTL_SECONDS = 5.0
+
+# Residency requested on every generation; matches model_warmup's
+# WARMUP_KEEP_ALIVE so a real request never shortens the heartbeat's window
+KEEP_ALIVE = "30m"
+
+# Parser for Ollama's NDJSON stream lines (orjson when installed)
+_loads = decode_record
 
 
 @dataclass
@@ -49,6 +62,9 @@ class StreamingLLM:
         ollama_url: str = OLLAMA_URL,
         min_chunk_chars: int = 20,
         max_chunk_chars: int = 100,
+        first_chunk_min_chars: int = 8,
+        num_ctx: Optional[int] = None,
+        num_predict: int = 256,
     ):
         """
         Initialize streaming LLM client.
@@ -58,12 +74,36 @@ class StreamingLLM:
             ollama_url: Ollama API endpoint
             min_chunk_chars: Minimum characters before emitting a chunk
             max_chunk_chars: Maximum characters before forcing chunk emit
+            first_chunk_min_chars: Minimum for the first chunk, so speech can
+                start on the opening callsign
+            num_ctx: Context window to request from Ollama (None = server
+                default). A smaller window means less prefill work and a faster
+                first token, but Ollama reloads the model whenever num_ctx
+                changes, so it must agree with any other client of the model
+            num_predict: Cap on generated tokens per response
         """
         self.model = model
         self.ollama_url = ollama_url
         self.min_chunk_chars = min_chunk_chars
         self.max_chunk_chars = max_chunk_chars
+        self.first_chunk_min_chars = first_chunk_min_chars
         self._stop_event = threading.Event()
+        self._available_until = 0.0  # perf_counter() deadline of last good probe
+        
+        # Request fields that don't change between calls, built once
+        self._options = {"num_predict": num_predict}
+        if num_ctx is not None:
+            self._options["num_ctx"] = num_ctx
+        self._payload_template = {
+            "stream": True,
+            "keep_alive": KEEP_ALIVE,
+            "options": self._options,
+        }
+        
+        # Keep-alive pool so the availability probe and each generation
+        # reuse the same connection to Ollama
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
         logger.info(f"StreamingLLM initialized with model={model}")
     
     def generate_stream(
@@ -82,24 +122,26 @@ class StreamingLLM:
             StreamChunk objects containing text and timing
         """
         self._stop_event.clear()
-        start_time = time.time()
+        perf_counter = time.perf_counter
+        start_time = perf_counter()
         first_token_time = None
-        buffer = ""
+        buffer = ""  # Kept left-trimmed, so chunks only need rstrip()
+        boundary_seen = False  # Buffer contains a phrase boundary
+        first = True  # No chunk emitted yet
+        response = None
+        done = False
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.ollama_url,
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": True,
-                },
+                json={**self._payload_template, "model": self.model, "prompt": prompt},
                 stream=True,
                 timeout=30,
             )
             response.raise_for_status()
             
-            for line in response.iter_lines():
+            lines = response.iter_lines()
+            for line in lines:
                 if self._stop_event.is_set():
                     break
                     
@@ -107,22 +149,25 @@ class StreamingLLM:
                     continue
                 
                 try:
-                    import json
-                    data = json.loads(line)
+                    data = _loads(line)
                     token = data.get("response", "")
                     done = data.get("done", False)
                     
                     if token:
                         if first_token_time is None:
-                            first_token_time = time.time()
-                            logger.debug(f"First token latency: {(first_token_time - start_time) * 1000:.0f}ms")
+                            first_token_time = perf_counter()
+                            logger.debug("First token latency: %.0fms", (first_token_time - start_time) * 1000)
                         
-                        buffer += token
+                        # Check for phrase boundary (only the new token needs scanning)
+                        if not boundary_seen and not PHRASE_BOUNDARIES.isdisjoint(token):
+                            boundary_seen = True
                         
-                        # Check for phrase boundary
-                        if self._should_emit_chunk(buffer, done):
+                        buffer += token.lstrip() if not buffer else token
+                        if self._should_emit_chunk(len(buffer), boundary_seen, done, first):
                             chunk = self._extract_chunk(buffer, done, start_time)
                             buffer = ""
+                            boundary_seen = False
+                            first = False
                             
                             if on_chunk:
                                 on_chunk(chunk)
@@ -130,11 +175,11 @@ class StreamingLLM:
                     
                     if done:
                         # Emit any remaining buffer
-                        if buffer.strip():
+                        if buffer:
                             chunk = StreamChunk(
-                                text=buffer.strip(),
+                                text=buffer.rstrip(),
                                 is_final=True,
-                                latency_ms=(time.time() - start_time) * 1000,
+                                latency_ms=(perf_counter() - start_time) * 1000,
                             )
                             if on_chunk:
                                 on_chunk(chunk)
@@ -147,46 +192,91 @@ class StreamingLLM:
                     
         except requests.exceptions.Timeout:
             logger.error("Ollama request timed out")
-            yield StreamChunk(text="", is_final=True, latency_ms=(time.time() - start_time) * 1000)
+            yield StreamChunk(text="", is_final=True, latency_ms=(perf_counter() - start_time) * 1000)
         except requests.exceptions.ConnectionError:
             logger.error("Cannot connect to Ollama. Is it running?")
+            self._available_until = 0.0
             yield StreamChunk(text="", is_final=True, latency_ms=0)
         except Exception as e:
             logger.error(f"Streaming error: {e}")
             yield StreamChunk(text="", is_final=True, latency_ms=0)
+        finally:
+            if response is not None:
+                if done:
+                    # Ollama has finished; read the end of the chunked body so
+                    # the connection goes back to the pool instead of closing
+                    for _ in lines:
+                        pass
+                response.close()
     
-    def _should_emit_chunk(self, buffer: str, is_done: bool) -> bool:
-        """Determine if buffer should be emitted as a chunk."""
+    def _should_emit_chunk(self, buffer_len: int, has_boundary: bool, is_done: bool, first: bool = False) -> bool:
+        """Determine if the buffer should be emitted as a chunk."""
         if is_done:
             return True
-        if len(buffer) >= self.max_chunk_chars:
+        if buffer_len >= self.max_chunk_chars:
             return True
-        if len(buffer) >= self.min_chunk_chars and PHRASE_BOUNDARIES.search(buffer):
+        min_chars = self.first_chunk_min_chars if first else self.min_chunk_chars
+        if buffer_len >= min_chars and has_boundary:
             return True
         return False
     
     def _extract_chunk(self, buffer: str, is_final: bool, start_time: float) -> StreamChunk:
-        """Extract a chunk from the buffer."""
+        """Extract a chunk from the (left-trimmed) buffer."""
         return StreamChunk(
-            text=buffer.strip(),
+            text=buffer.rstrip(),
             is_final=is_final,
-            latency_ms=(time.time() - start_time) * 1000,
+            latency_ms=(time.perf_counter() - start_time) * 1000,
         )
     
     def stop(self):
         """Stop any ongoing generation."""
         self._stop_event.set()
     
+    def prewarm(self) -> bool:
+        """
+        Load the model with a one-token request so the first real
+        generation doesn't pay the cold-start cost.
+        
+        Returns:
+            True if Ollama answered
+        """
+        start = time.perf_counter()
+        try:
+            response = self._session.post(
+                self.ollama_url,
+                json={
+                    "model": self.model,
+                    "prompt": ".",
+                    "stream": False,
+                    "keep_alive": KEEP_ALIVE,
+                    # Same context size as real requests, or Ollama reloads
+                    "options": {**self._options, "num_predict": 1},
+                },
+                timeout=60,
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.debug("Prewarm skipped: %s", e)
+            return False
+        logger.info(f"Model prewarmed in {(time.perf_counter() - start) * 1000:.0f}ms")
+        return True
+    
     def is_available(self) -> bool:
-        """Check if Ollama is available."""
+        """Check if Ollama is available (a success is reused for AVAILABILITY_TTL_SECONDS)."""
+        now = time.perf_counter()
+        if now < self._available_until:
+            return True
         try:
-            response = requests.get(
+            response = self._session.get(
                 "http://localhost:11434/api/tags",
                 timeout=2,
             )
-            return response.status_code == 200
+            ok = response.status_code == 200
         except:
-            return False
+            ok = False
+        # Failures aren't cached: a refused connection is cheap to re-probe
+        self._available_until = now + AVAILABILITY_TTL_SECONDS if ok else 0.0
+        return ok
 
 
 class StreamingATCController:
@@ -212,9 +302,15 @@ class StreamingATCController:
         """
         self.llm = StreamingLLM(model=model)
         self.speak_func = speak_func
-        self._chunk_queue = queue.Queue()
         self._processing = False
-        self._worker_thread: Optional[threading.Thread] = None
+        
+        # One worker each: requests run one at a time, and a single TTS
+        # worker speaks chunks in the order they were submitted
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="atc-stream")
+        self._tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="atc-tts")
+        
+        # Load the model in the background so the first exchange is warm
+        threading.Thread(target=self.llm.prewarm, daemon=True).start()
         logger.info("StreamingATCController initialized")
     
     def process_request(
@@ -238,15 +334,22 @@ class StreamingATCController:
         
         self._processing = True
         full_response = []
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        # Speak on the TTS worker so it overlaps with token generation
+        last_spoken: Optional[Future] = None
         
         def on_chunk(chunk: StreamChunk):
             """Handle each streamed chunk."""
+            nonlocal last_spoken
             if chunk.text:
                 full_response.append(chunk.text)
                 # Send to TTS immediately
-                logger.debug(f"Streaming chunk to TTS: '{chunk.text[:30]}...' ({chunk.latency_ms:.0f}ms)")
-                self.speak_func(chunk.text)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Streaming chunk to TTS: '%s...' (%.0fms)", chunk.text[:30], chunk.latency_ms)
+                # Chunks only get the cheap TTS clean-up; the full validation
+                # runs once on the complete response below
+                last_spoken = self._tts_executor.submit(self._speak_chunk, sanitize_for_tts(chunk.text))
         
         # Process in current thread (blocking) or spawn thread
         try:
@@ -254,9 +357,25 @@ class StreamingATCController:
                 if chunk.is_final:
                     break
             
-            total_latency = (time.time() - start_time) * 1000
             complete_text = " ".join(full_response)
             
+            # STRATUS-003: Validate the complete response once (the chunks
+            # were already spoken); follow up with the fallback if it fails
+            if full_response:
+                validation = validate_atc_response(complete_text)
+                if validation.valid:
+                    complete_text = validation.cleaned_response
+                else:
+                    logger.warning(f"Streamed ATC response failed validation: {validation.issues}")
+                    complete_text = get_fallback_response()
+                    last_spoken = self._tts_executor.submit(self._speak_chunk, complete_text)
+            
+            # Let the queued phrases finish speaking before reporting completion
+            if last_spoken is not None:
+                last_spoken.result()
+            
+            total_latency = (time.perf_counter() - start_time) * 1000
+            
             if on_complete:
                 on_complete(complete_text, total_latency)
             
@@ -269,17 +388,20 @@ class StreamingATCController:
         finally:
             self._processing = False
     
+    def _speak_chunk(self, text: str):
+        """Speak one chunk on the TTS worker."""
+        try:
+            self.speak_func(text)
+        except Exception as e:
+            logger.warning(f"Error speaking chunk: {e}")
+    
     def process_request_async(
         self,
         prompt: str,
         on_complete: Optional[Callable[[str, float], None]] = None,
     ):
-        """Process request in background thread."""
-        def worker():
-            self.process_request(prompt, on_complete)
-        
-        self._worker_thread = threading.Thread(target=worker, daemon=True)
-        self._worker_thread.start()
+        """Process request on the background worker."""
+        self._executor.submit(self.process_request, prompt, on_complete)
     
     def stop(self):
         """Stop current processing."""
@@ -80,6 +80,60 @@ IFR_SCOPE_VIOLATIONS = [
     (r"\bcleared to.*via\b", "IFR routing - out of scope"),
 ]
 
+
+def _compile_table(table: List[Tuple[str, str]]) -> List[Tuple[re.Pattern, str]]:
+    """Compile (pattern, description) pairs, case-insensitive."""
+    return [(re.compile(pattern, re.IGNORECASE), description) for pattern, description in table]
+
+
+def _compile_any(*tables: List[Tuple[str, str]]) -> re.Pattern:
+    """One alternation that matches wherever any pattern in the tables would."""
+    return re.compile(
+        "|".join(f"(?:{pattern})" for table in tables for pattern, _ in table),
+        re.IGNORECASE,
+    )
+
+
+# A pattern with no regex syntax besides escaped punctuation
+_LITERAL_PATTERN_RE = re.compile(r"(?:\\[^\w]|[^\\.^$*+?{}\[\]|()])*")
+
+
+def _literal_of(pattern: str) -> Optional[str]:
+    """The lowercased text a pattern matches literally, or None if it is a real regex."""
+    if _LITERAL_PATTERN_RE.fullmatch(pattern) is None:
+        return None
+    return re.sub(r"\\(.)", r"\1", pattern).lower()
+
+
+_SUSPICIOUS_RES = _compile_table(SUSPICIOUS_PATTERNS)
+# (compiled, description, literal) - literal entries are checked with a
+# substring test, which matches IGNORECASE exactly for ASCII text
+_SUSPICIOUS_CHECKS = [
+    (compiled, description, _literal_of(pattern))
+    for (compiled, description), (pattern, _) in zip(_SUSPICIOUS_RES, SUSPICIOUS_PATTERNS)
+]
+_PROHIBITED_RES = _compile_table(PROHIBITED_PHRASES)
+_IFR_SCOPE_RES = _compile_table(IFR_SCOPE_VIOLATIONS)
+
+# Prefilters: most responses are clean, so one combined search usually
+# replaces a search per pattern. On a hit the per-pattern loop still runs so
+# issues, their order and the removals stay exactly as before.
+_SUSPICIOUS_ANY = _compile_any(SUSPICIOUS_PATTERNS)
+_PHRASEOLOGY_ANY = _compile_any(PROHIBITED_PHRASES, IFR_SCOPE_VIOLATIONS)
+
+_ALTITUDE_RE = re.compile(r"(\d{1,6})\s*(?:feet|ft|')", re.IGNORECASE)
+_FLIGHT_LEVEL_RE = re.compile(r"FL\s*(\d{2,3})", re.IGNORECASE)
+_FREQUENCY_RE = re.compile(r"(\d{3}[.,]\d{1,3})")
+_SQUAWK_RE = re.compile(r"squawk\s*(\d{4})", re.IGNORECASE)
+_TAXI_RUNWAY_RE = re.compile(r"\btaxi\b.*\brunway\b", re.IGNORECASE)
+_HOLD_SHORT_RE = re.compile(r"hold short", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_HOLD_SHORT_RUNWAY_RE = re.compile(r"hold short (?:of )?runway (\d+[LRC]?)", re.IGNORECASE)
+_RUNWAY_CLEARANCE_RE = re.compile(r"cleared (?:for |to )?(?:takeoff|land|the option)", re.IGNORECASE)
+_RUNWAY_NUMBER_RE = re.compile(r"runway (\d+[LRC]?)", re.IGNORECASE)
+_FREQUENCY_CHANGE_RE = re.compile(r"(?:contact|monitor).*?(\d{3}\.\d{1,3})", re.IGNORECASE)
+
 # Realistic ATC value ranges
 ATC_VALIDATION_RULES = {
     "altitude_max": 60000,      # FL600 max
@@ -103,6 +157,29 @@ def validate_atc_response(response: str) -> ValidationResult:
     Returns:
         ValidationResult with validity, cleaned response, and issues found
     """
+    return _validate(response, True, True)
+
+
+def validate_atc_batch(responses: List[str]) -> List[ValidationResult]:
+    """
+    Validate several responses (e.g. streamed chunks) at once.
+    
+    The pattern prefilters run once over all responses together; when
+    nothing suspicious or out of phraseology appears anywhere, every
+    response skips those checks.
+    
+    Returns:
+        One ValidationResult per response, same as validate_atc_response
+    """
+    joined = "\n".join(responses)
+    screen_suspicious = _SUSPICIOUS_ANY.search(joined) is not None
+    # Removing suspicious text can create new phrase matches, so re-screen then
+    screen_phraseology = screen_suspicious or _PHRASEOLOGY_ANY.search(joined) is not None
+    return [_validate(r, screen_suspicious, screen_phraseology) for r in responses]
+
+
+def _validate(response: str, screen_suspicious: bool, screen_phraseology: bool) -> ValidationResult:
+    """validate_atc_response(); the flags are False when a batch prefilter ruled the checks out."""
     if not response:
         return ValidationResult(
             valid=False,
@@ -117,24 +194,42 @@ def validate_atc_response(response: str) -> ValidationResult:
     original = cleaned
     
     # Check for suspicious patterns (critical)
-    for pattern, description in SUSPICIOUS_PATTERNS:
-        if re.search(pattern, cleaned, re.IGNORECASE):
-            issues.append(f"Contains {description}")
-            cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+    if screen_suspicious and _SUSPICIOUS_ANY.search(cleaned):
+        # Non-ASCII text goes through the regexes: casefolding differs from
+        # IGNORECASE for characters such as dotless i
+        ascii_lower = cleaned.lower() if cleaned.isascii() else None
+        for pattern, description, literal in _SUSPICIOUS_CHECKS:
+            if literal is not None and ascii_lower is not None:
+                found = literal in ascii_lower
+            else:
+                found = pattern.search(cleaned) is not None
+            if found:
+                issues.append(f"Contains {description}")
+                cleaned = pattern.sub("", cleaned)
+                if ascii_lower is not None:
+                    ascii_lower = cleaned.lower()
+        # Removals can leave whitespace at the ends; otherwise cleaned is
+        # still the stripped response
+        cleaned = cleaned.strip()
     
-    # Check for prohibited phraseology (warning)
-    for pattern, description in PROHIBITED_PHRASES:
-        if re.search(pattern, cleaned, re.IGNORECASE):
-            warnings.append(f"Prohibited: {description}")
+    if screen_phraseology and _PHRASEOLOGY_ANY.search(cleaned):
+        # Check for prohibited phraseology (warning)
+        for pattern, description in _PROHIBITED_RES:
+            if pattern.search(cleaned):
+                warnings.append(f"Prohibited: {description}")
+        
+        # Check for IFR scope violations (warning but flag prominently)
+        for pattern, description in _IFR_SCOPE_RES:
+            if pattern.search(cleaned):
+                warnings.append(f"SCOPE: {description}")
+                logger.warning(f"[VALIDATION] Out of scope IFR content detected: {description}")
     
-    # Check for IFR scope violations (warning but flag prominently)
-    for pattern, description in IFR_SCOPE_VIOLATIONS:
-        if re.search(pattern, cleaned, re.IGNORECASE):
-            warnings.append(f"SCOPE: {description}")
-            logger.warning(f"[VALIDATION] Out of scope IFR content detected: {description}")
+    # The numeric checks below each need a keyword or unit; skip the scans
+    # whose keyword is absent (one casefolded copy, then substring tests)
+    lowered = cleaned.casefold()
     
     # Check for unrealistic altitudes
-    altitude_matches = re.findall(r"(\d{1,6})\s*(?:feet|ft|')", cleaned, re.IGNORECASE)
+    altitude_matches = _ALTITUDE_RE.findall(cleaned) if ("ft" in lowered or "feet" in lowered or "'" in cleaned) else ()
     for alt_str in altitude_matches:
         try:
             alt = int(alt_str)
@@ -144,7 +239,7 @@ def validate_atc_response(response: str) -> ValidationResult:
             pass
     
     # Check for unrealistic flight levels
-    fl_matches = re.findall(r"FL\s*(\d{2,3})", cleaned, re.IGNORECASE)
+    fl_matches = _FLIGHT_LEVEL_RE.findall(cleaned) if "fl" in lowered else ()
     for fl_str in fl_matches:
         try:
             fl = int(fl_str) * 100  # FL350 = 35000ft
@@ -154,7 +249,7 @@ def validate_atc_response(response: str) -> ValidationResult:
             pass
     
     # Check for invalid frequencies
-    freq_matches = re.findall(r"(\d{3}[.,]\d{1,3})", cleaned)
+    freq_matches = _FREQUENCY_RE.findall(cleaned)
     for freq_str in freq_matches:
         try:
             freq = float(freq_str.replace(",", "."))
@@ -165,10 +260,10 @@ def validate_atc_response(response: str) -> ValidationResult:
             pass
     
     # Check for invalid squawk codes
-    squawk_matches = re.findall(r"squawk\s*(\d{4})", cleaned, re.IGNORECASE)
+    squawk_matches = _SQUAWK_RE.findall(cleaned) if "squawk" in lowered else ()
     for squawk_str in squawk_matches:
         try:
-            if any(d in squawk_str for d in "89"):
+            if "8" in squawk_str or "9" in squawk_str:
                 issues.append(f"Invalid squawk code (contains 8 or 9): {squawk_str}")
             elif int(squawk_str) > ATC_VALIDATION_RULES["squawk_max"]:
                 issues.append(f"Invalid squawk code: {squawk_str}")
@@ -176,17 +271,16 @@ def validate_atc_response(response: str) -> ValidationResult:
             pass
     
     # Validate taxi instructions have hold short (if mentions taxiway)
-    if re.search(r"\btaxi\b.*\brunway\b", cleaned, re.IGNORECASE):
-        if not re.search(r"hold short", cleaned, re.IGNORECASE):
+    if _TAXI_RUNWAY_RE.search(cleaned):
+        if not _HOLD_SHORT_RE.search(cleaned):
             warnings.append("Taxi instruction should include 'hold short' when crossing runways")
     
-    # Clean up whitespace and quotes
-    cleaned = cleaned.strip()
+    # Clean up quotes and whitespace
     if cleaned.startswith('"') and cleaned.endswith('"'):
         cleaned = cleaned[1:-1]
     if cleaned.startswith("'") and cleaned.endswith("'"):
         cleaned = cleaned[1:-1]
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = _WHITESPACE_RE.sub(' ', cleaned)
     
     # Check minimum response length
     if len(cleaned) < 5:
@@ -195,7 +289,8 @@ def validate_atc_response(response: str) -> ValidationResult:
     # Log issues if any
     if issues:
         logger.warning(f"[VALIDATION] Issues found: {issues}")
-        logger.debug(f"[VALIDATION] Original: {original[:100]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[VALIDATION] Original: %s...", original[:100])
     if warnings:
         logger.info(f"[VALIDATION] Warnings: {warnings}")
     
@@ -228,27 +323,33 @@ def check_readback_required(atc_instruction: str) -> List[str]:
     """
     requires_readback = []
     
+    # Each check needs its keyword, so on ASCII text a substring test rules
+    # most regexes out. Non-ASCII text is always searched: IGNORECASE folds
+    # characters (e.g. dotted I) that lower() doesn't.
+    lowered = atc_instruction.lower() if atc_instruction.isascii() else None
+    
     # Hold short is mandatory
-    if re.search(r"hold short", atc_instruction, re.IGNORECASE):
-        match = re.search(r"hold short (?:of )?runway (\d+[LRC]?)", atc_instruction, re.IGNORECASE)
+    if (lowered is None or "hold short" in lowered) and _HOLD_SHORT_RE.search(atc_instruction):
+        match = _HOLD_SHORT_RUNWAY_RE.search(atc_instruction)
         if match:
             requires_readback.append(f"Hold short runway {match.group(1)}")
         else:
             requires_readback.append("Hold short instruction")
     
     # Runway assignments (takeoff/landing clearance)
-    if re.search(r"cleared (?:for |to )?(?:takeoff|land|the option)", atc_instruction, re.IGNORECASE):
-        match = re.search(r"runway (\d+[LRC]?)", atc_instruction, re.IGNORECASE)
+    if (lowered is None or "cleared" in lowered) and _RUNWAY_CLEARANCE_RE.search(atc_instruction):
+        match = _RUNWAY_NUMBER_RE.search(atc_instruction)
         if match:
             requires_readback.append(f"Runway {match.group(1)}")
     
     # Frequency changes
-    freq_match = re.search(r"(?:contact|monitor).*?(\d{3}\.\d{1,3})", atc_instruction, re.IGNORECASE)
+    has_freq_keyword = lowered is None or "contact" in lowered or "monitor" in lowered
+    freq_match = _FREQUENCY_CHANGE_RE.search(atc_instruction) if has_freq_keyword else None
     if freq_match:
         requires_readback.append(f"Frequency {freq_match.group(1)}")
     
     # Transponder codes
-    squawk_match = re.search(r"squawk\s*(\d{4})", atc_instruction, re.IGNORECASE)
+    squawk_match = _SQUAWK_RE.search(atc_instruction) if (lowered is None or "squawk" in lowered) else None
     if squawk_match:
         requires_readback.append(f"Squawk {squawk_match.group(1)}")
     
@@ -279,8 +380,8 @@ def is_within_scope(response: str) -> Tuple[bool, str]:
     Returns:
         (is_in_scope, reason) tuple
     """
-    for pattern, description in IFR_SCOPE_VIOLATIONS:
-        if re.search(pattern, response, re.IGNORECASE):
+    for pattern, description in _IFR_SCOPE_RES:
+        if pattern.search(response):
             return False, description
     return True, ""
 
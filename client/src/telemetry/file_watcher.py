@@ -5,6 +5,19 @@ import logging
 from typing import Dict, Optional, Callable
 from threading import Thread, Event
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    HAS_INOTIFY = True
+except ImportError:
+    HAS_INOTIFY = False
+
 class StratusTelemetryWatcher:
     """
     Watches the stratus_telemetry.json file for updates from the X-Plane plugin.
@@ -19,6 +32,7 @@ class StratusTelemetryWatcher:
         self._thread: Optional[Thread] = None
         self._stop_event = Event()
         self.last_mtime = 0
+        self._last_bytes = b""  # Raw content of the last successful read
         self.latest_data: Dict = {}
         self.on_data_update: Optional[Callable[[Dict], None]] = None
         self.logger = logging.getLogger("StratusTelemetryWatcher")
@@ -45,6 +59,29 @@ class StratusTelemetryWatcher:
             self._thread.join()
 
     def _watch_loop(self):
+        if HAS_INOTIFY:
+            try:
+                self._inotify_loop()
+                return
+            except OSError as e:
+                self.logger.warning(f"inotify unavailable ({e}), falling back to polling")
+        self._poll_loop()
+
+    def _inotify_loop(self):
+        """Block on kernel change events for the input file instead of polling."""
+        name = os.path.basename(self.input_file)
+        with INotify() as inotify:
+            # Watch the directory: writers replace the file via rename, which
+            # would orphan a watch on the file itself
+            inotify.add_watch(self.data_dir, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+            self._read_input()  # Pick up whatever is already there
+            while self.running:
+                # Timeout so stop() is noticed; one read per batch of events
+                events = inotify.read(timeout=500)
+                if any(event.name == name for event in events):
+                    self._read_input()
+
+    def _poll_loop(self):
         while self.running:
             try:
                 if os.path.exists(self.input_file):
@@ -55,16 +92,21 @@ class StratusTelemetryWatcher:
             except Exception as e:
                 self.logger.error(f"Error checking file: {e}")
             
-            time.sleep(0.5) # Check every 500ms
+            self._stop_event.wait(0.5) # Check every 500ms
 
     def _read_input(self):
         try:
-            with open(self.input_file, 'r') as f:
-                data = json.load(f)
-                self.latest_data = data
-                if self.on_data_update:
-                    self.on_data_update(data)
-                self.logger.debug("Stratus telemetry updated")
+            with open(self.input_file, 'rb') as f:
+                raw = f.read()
+            # Re-saved without changes: nothing to parse or notify
+            if raw == self._last_bytes:
+                return
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            self._last_bytes = raw
+            self.latest_data = data
+            if self.on_data_update:
+                self.on_data_update(data)
+            self.logger.debug("Stratus telemetry updated")
         except json.JSONDecodeError:
             self.logger.warning("Failed to decode JSON from input file (sim writing?)")
         except Exception as e:
@@ -73,7 +115,8 @@ class StratusTelemetryWatcher:
     def send_command(self, command: Dict):
         """Append a command to the output JSONL file"""
         try:
-            with open(self.output_file, 'a') as f:
-                f.write(json.dumps(command) + "\n")
+            line = orjson.dumps(command) + b"\n" if HAS_ORJSON else (json.dumps(command) + "\n").encode()
+            with open(self.output_file, 'ab') as f:
+                f.write(line)
         except Exception as e:
             self.logger.error(f"Error writing output: {e}")
@@ -238,6 +238,11 @@ class CommsHistoryWidget(QWidget):
     
     def add_message(self, message: CommMessage):
         """Add a new message to the history."""
+        self._add_bubble(message)
+        self._scroll_to_bottom()
+    
+    def _add_bubble(self, message: CommMessage):
+        """Create and insert the bubble for a message (no scrolling)."""
         # Hide empty label
         self.empty_label.hide()
         
@@ -250,8 +255,9 @@ class CommsHistoryWidget(QWidget):
         
         # Insert before the stretch
         self.messages_layout.insertWidget(self.messages_layout.count() - 1, bubble)
-        
-        # Scroll to bottom
+    
+    def _scroll_to_bottom(self):
+        """Scroll the history to the newest message."""
         self.scroll_area.verticalScrollBar().setValue(
             self.scroll_area.verticalScrollBar().maximum()
         )
@@ -282,6 +288,20 @@ class CommsHistoryWidget(QWidget):
         """Update from a list of CommEntry objects from SAPI."""
         existing_ids = {m.id for m in self._messages}
         
+        # Insert the whole batch with painting suspended, then repaint and
+        # scroll once instead of once per new message
+        self.messages_container.setUpdatesEnabled(False)
+        try:
+            added = self._add_entries(entries, existing_ids)
+        finally:
+            self.messages_container.setUpdatesEnabled(True)
+        
+        if added:
+            self._scroll_to_bottom()
+    
+    def _add_entries(self, entries: list, existing_ids: set) -> int:
+        """Add bubbles for entries not already shown or cleared; returns how many."""
+        added = 0
         for i, entry in enumerate(entries):
             # Use URL hash as ID
             msg_id = hash(entry.atc_url) if entry.atc_url else hash(entry.outgoing_message + str(i))
@@ -301,4 +321,6 @@ class CommsHistoryWidget(QWidget):
                 audio_url=entry.atc_url,
                 timestamp=datetime.now()
             )
-            self.add_message(msg)
+            self._add_bubble(msg)
+            added += 1
+        return added
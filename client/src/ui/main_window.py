@@ -428,6 +428,7 @@ class MainWindow(QMainWindow):
         
         # Initialize sim data interface for X-Plane communication
         self.sim_data = SimDataInterface()
+        self._last_radio_state = None  # Last radio state pushed to the UI
         
         # Start telemetry polling (every 500ms to update frequencies)
         self._telemetry_timer = QTimer(self)
@@ -764,7 +765,7 @@ class MainWindow(QMainWindow):
                 })
             self.sim_data.write_comms_for_overlay(overlay_msgs, self.sapi.is_connected)
         except Exception as e:
-            logger.debug(f"Failed to update overlay: {e}")
+            logger.debug("Failed to update overlay: %s", e)
         
         # Update ComLink with comms
         if self.comlink:
@@ -1093,52 +1094,62 @@ class MainWindow(QMainWindow):
         try:
             telemetry = self.sim_data.read_telemetry()
             
-            # Update frequency displays
-            if telemetry.com1.power:
-                self.frequency_panel.update_com1(
-                    telemetry.com1.active, 
-                    telemetry.com1.standby
-                )
-            else:
-                self.frequency_panel.update_com1("OFF", "---")
+            # Radio state shown in the panels and on ComLink; skip the widget
+            # and socket updates when nothing visible changed since last tick
+            radio_state = (
+                telemetry.com1.power, telemetry.com1.active, telemetry.com1.standby,
+                telemetry.com2.power, telemetry.com2.active, telemetry.com2.standby,
+                telemetry.transponder.code, telemetry.transponder.mode,
+            )
+            if radio_state != self._last_radio_state:
+                self._last_radio_state = radio_state
+                
+                # Update frequency displays
+                if telemetry.com1.power:
+                    self.frequency_panel.update_com1(
+                        telemetry.com1.active, 
+                        telemetry.com1.standby
+                    )
+                else:
+                    self.frequency_panel.update_com1("OFF", "---")
             
-            if telemetry.com2.power:
-                self.frequency_panel.update_com2(
-                    telemetry.com2.active,
-                    telemetry.com2.standby
-                )
-            else:
-                self.frequency_panel.update_com2("OFF", "---")
+                if telemetry.com2.power:
+                    self.frequency_panel.update_com2(
+                        telemetry.com2.active,
+                        telemetry.com2.standby
+                    )
+                else:
+                    self.frequency_panel.update_com2("OFF", "---")
             
-            # Update transponder
-            self.frequency_panel.update_transponder(
-                telemetry.transponder.code,
-                telemetry.transponder.mode
-            )
+                # Update transponder
+                self.frequency_panel.update_transponder(
+                    telemetry.transponder.code,
+                    telemetry.transponder.mode
+                )
             
-            # STRATUS-002: Update header frequency display
-            com1_freq = telemetry.com1.active if telemetry.com1.power else "OFF"
-            com2_freq = telemetry.com2.active if telemetry.com2.power else "OFF"
-            self.status_panel.set_frequencies(com1_freq, com2_freq)
+                # STRATUS-002: Update header frequency display
+                com1_freq = telemetry.com1.active if telemetry.com1.power else "OFF"
+                com2_freq = telemetry.com2.active if telemetry.com2.power else "OFF"
+                self.status_panel.set_frequencies(com1_freq, com2_freq)
             
-            # Update ComLink with telemetry
-            if self.comlink:
-                self.comlink.update_telemetry({
-                    "com1": {
-                        "active": telemetry.com1.active if telemetry.com1.power else "OFF",
-                        "standby": telemetry.com1.standby if telemetry.com1.power else "---",
-                        "power": telemetry.com1.power
-                    },
-                    "com2": {
-                        "active": telemetry.com2.active if telemetry.com2.power else "OFF",
-                        "standby": telemetry.com2.standby if telemetry.com2.power else "---",
-                        "power": telemetry.com2.power
-                    },
-                    "transponder": {
-                        "code": telemetry.transponder.code,
-                        "mode": telemetry.transponder.mode
-                    }
-                })
+                # Update ComLink with telemetry
+                if self.comlink:
+                    self.comlink.update_telemetry({
+                        "com1": {
+                            "active": telemetry.com1.active if telemetry.com1.power else "OFF",
+                            "standby": telemetry.com1.standby if telemetry.com1.power else "---",
+                            "power": telemetry.com1.power
+                        },
+                        "com2": {
+                            "active": telemetry.com2.active if telemetry.com2.power else "OFF",
+                            "standby": telemetry.com2.standby if telemetry.com2.power else "---",
+                            "power": telemetry.com2.power
+                        },
+                        "transponder": {
+                            "code": telemetry.transponder.code,
+                            "mode": telemetry.transponder.mode
+                        }
+                    })
             
             # --- UPLINK TO ATC CLOUD ---
             now = time.time()
@@ -1174,7 +1185,7 @@ class MainWindow(QMainWindow):
                 
                 self._run_in_background(
                     lambda: self.sapi.update_telemetry(uplink_data),
-                    lambda response: logger.debug(f"SAPI Telemetry Uplink: {response.success}")
+                    lambda response: logger.debug("SAPI Telemetry Uplink: %s", response.success)
                 )
                 
                 # --- FORCE LOCATION UPDATE ---
@@ -1202,7 +1213,7 @@ class MainWindow(QMainWindow):
 
             
         except Exception as e:
-            logger.debug(f"Telemetry update error: {e}")
+            logger.debug("Telemetry update error: %s", e)
     
     # =========================================================================
     # View Options
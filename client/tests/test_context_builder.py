@@ -0,0 +1,52 @@
+"""
+Unit tests for context building.
+
+Tests ConversationBuffer eviction and transcript formatting.
+"""
+
+import pytest
+import sys
+import os
+
+# Add project path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.context_builder import ConversationBuffer
+
+
+@pytest.fixture
+def buffer():
+    """A three-turn buffer after five appends."""
+    buffer = ConversationBuffer(max_turns=3)
+    for i in range(5):
+        buffer.append("pilot" if i % 2 == 0 else "atc", f"turn {i}")
+    return buffer
+
+
+def test_eviction_keeps_last_turns(buffer):
+    assert len(buffer) == 3
+    assert [t["message"] for t in buffer.turns] == ["turn 2", "turn 3", "turn 4"]
+    assert buffer.format() == "Pilot: turn 2\nATC: turn 3\nPilot: turn 4"
+
+
+@pytest.mark.parametrize("max_turns, expected", [
+    (1, "Pilot: turn 4"),
+    (2, "ATC: turn 3\nPilot: turn 4"),
+    (3, "Pilot: turn 2\nATC: turn 3\nPilot: turn 4"),
+    (10, "Pilot: turn 2\nATC: turn 3\nPilot: turn 4"),
+])
+def test_format_last_turns(buffer, max_turns, expected):
+    assert buffer.format(max_turns) == expected
+
+
+def test_clear(buffer):
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.format() == ""
+    buffer.append("atc", "again")
+    assert buffer.format() == "ATC: again"
+
+
+def test_max_turns_must_be_positive():
+    with pytest.raises(ValueError):
+        ConversationBuffer(0)
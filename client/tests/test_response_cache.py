@@ -0,0 +1,84 @@
+"""
+Unit tests for the speculative response cache.
+
+Tests fuzzy_match() keyword and misrecognition matching.
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+# Add project path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.response_cache import SpeculativeCache, FlightPhase, INTENT_KEYWORDS, PHASE_INTENTS
+
+
+@pytest.fixture
+def cache():
+    """A cache holding a response for every intent."""
+    cache = SpeculativeCache(generate_func=lambda prompt: f"response to {prompt}")
+    for intent_key in INTENT_KEYWORDS:
+        cache._generate_and_cache(
+            intent_key, intent_key, FlightPhase.CRUISE, cache._current_context_hash
+        )
+    return cache
+
+
+@pytest.mark.parametrize("message, intent_key", [
+    ("Radio check", "radio_check"),
+    ("raido check", "radio_check"),
+    ("requesting flite following", "request_flight_following"),
+    ("flite following", "request_flight_following"),
+    ("how do you reed", "radio_check"),
+    ("airport in site", "airport_in_sight"),
+])
+def test_fuzzy_match(cache, message, intent_key):
+    match = cache.fuzzy_match(message)
+    assert match is not None
+    assert match[0] == intent_key
+
+
+@pytest.mark.parametrize("message", [
+    "positive rate, gear up",
+    "request transition",
+    "going around",
+    "say again",
+])
+def test_fuzzy_no_match(cache, message):
+    assert cache.fuzzy_match(message) is None
+
+
+def test_stale_generation_dropped_after_context_change():
+    """Generations already running when the context changes aren't cached."""
+    intents = [intent_key for intent_key, _ in PHASE_INTENTS[FlightPhase.PARKED]]
+    started = threading.Semaphore(0)
+    release = threading.Event()
+    
+    def generate(prompt):
+        airport = "KSFO" if "KSFO" in prompt else "KOAK"
+        if airport == "KSFO":
+            started.release()
+            release.wait(5)
+        return f"{airport} response"
+    
+    cache = SpeculativeCache(generate_func=generate)
+    cache.start()
+    try:
+        cache.update_context(FlightPhase.PARKED, "KSFO", "28L", "N123AB", "121.8")
+        for _ in intents:
+            assert started.acquire(timeout=5)
+        
+        # KSFO generations are running and can't be cancelled
+        cache.update_context(FlightPhase.PARKED, "KOAK", "30", "N123AB", "121.9")
+        release.set()
+        for future in cache._pending:
+            future.result(timeout=5)
+        cache._pool.shutdown(wait=True)
+        
+        for intent_key in intents:
+            assert cache.get(intent_key) == "KOAK response"
+    finally:
+        release.set()
+        cache.stop()
@@ -18,87 +18,51 @@ from core.validation import (
 )
 
 
+# (utterance, expected readback elements) - ids name the case
+READBACK_CASES = [
+    pytest.param(
+        "Taxi to runway 28 via Alpha, hold short of runway 10",
+        ["Hold short runway 10"],
+        id="hold_short_runway",
+    ),
+    pytest.param("Hold short", ["Hold short instruction"], id="hold_short_generic"),
+    pytest.param(
+        "Cessna 12345, runway 28, cleared for takeoff",
+        ["Runway 28"],
+        id="takeoff_clearance_runway",
+    ),
+    pytest.param(
+        "Cessna 12345, cleared to land runway 28L",
+        ["Runway 28L"],
+        id="landing_clearance_runway",
+    ),
+    pytest.param(
+        "Cessna 12345, cleared for the option runway 28",
+        ["Runway 28"],
+        id="cleared_for_option",
+    ),
+    pytest.param("Contact Oakland Approach on 124.5", ["Frequency 124.5"], id="frequency_contact"),
+    pytest.param("Monitor ATIS on 127.85", ["Frequency 127.85"], id="frequency_monitor"),
+    pytest.param("Cessna 12345, squawk 4521", ["Squawk 4521"], id="squawk_code"),
+    pytest.param(
+        "Taxi to runway 28 via Alpha, hold short of runway 10, "
+        "squawk 4521, contact tower on 118.3",
+        ["Hold short runway 10", "Frequency 118.3", "Squawk 4521"],
+        id="multiple_readbacks",
+    ),
+    # Traffic advisories and radar contact don't require readback
+    pytest.param("Traffic 2 o'clock, 3 miles, southbound", [], id="no_readback_traffic"),
+    pytest.param("Radar contact, 5 miles south of Oakland", [], id="no_readback_radar_contact"),
+]
+
+
 class TestCheckReadbackRequired:
     """Tests for check_readback_required() function."""
     
-    def test_hold_short_runway(self):
-        """Hold short instructions require readback."""
-        result = check_readback_required(
-            "Taxi to runway 28 via Alpha, hold short of runway 10"
-        )
-        assert "Hold short runway 10" in result
-    
-    def test_hold_short_generic(self):
-        """Generic hold short should still be caught."""
-        result = check_readback_required("Hold short")
-        assert "Hold short instruction" in result
-    
-    def test_takeoff_clearance_runway(self):
-        """Takeoff clearance with runway requires readback."""
-        result = check_readback_required(
-            "Cessna 12345, runway 28, cleared for takeoff"
-        )
-        assert "Runway 28" in result
-    
-    def test_landing_clearance_runway(self):
-        """Landing clearance with runway requires readback."""
-        result = check_readback_required(
-            "Cessna 12345, cleared to land runway 28L"
-        )
-        assert "Runway 28L" in result
-    
-    def test_cleared_for_option(self):
-        """Cleared for the option requires readback."""
-        result = check_readback_required(
-            "Cessna 12345, cleared for the option runway 28"
-        )
-        assert "Runway 28" in result
-    
-    def test_frequency_contact(self):
-        """Frequency changes require readback."""
-        result = check_readback_required(
-            "Contact Oakland Approach on 124.5"
-        )
-        assert "Frequency 124.5" in result
-    
-    def test_frequency_monitor(self):
-        """Monitor instructions also require readback."""
-        result = check_readback_required(
-            "Monitor ATIS on 127.85"
-        )
-        assert "Frequency 127.85" in result
-    
-    def test_squawk_code(self):
-        """Squawk codes require readback."""
-        result = check_readback_required(
-            "Cessna 12345, squawk 4521"
-        )
-        assert "Squawk 4521" in result
-    
-    def test_multiple_readbacks(self):
-        """Complex instruction with multiple readback elements."""
-        result = check_readback_required(
-            "Taxi to runway 28 via Alpha, hold short of runway 10, "
-            "squawk 4521, contact tower on 118.3"
-        )
-        assert len(result) >= 3
-        assert any("Hold short" in r for r in result)
-        assert any("Squawk" in r for r in result)
-        assert any("Frequency" in r for r in result)
-    
-    def test_no_readback_traffic(self):
-        """Traffic advisories don't require readback."""
-        result = check_readback_required(
-            "Traffic 2 o'clock, 3 miles, southbound"
-        )
-        assert len(result) == 0
-    
-    def test_no_readback_radar_contact(self):
-        """Radar contact doesn't require readback."""
-        result = check_readback_required(
-            "Radar contact, 5 miles south of Oakland"
-        )
-        assert len(result) == 0
+    @pytest.mark.parametrize("utterance,expected", READBACK_CASES)
+    def test_readback(self, utterance, expected):
+        """Exactly the expected elements are flagged, in check order."""
+        assert check_readback_required(utterance) == expected
 
 
 class TestValidateAtcResponse:
@@ -124,14 +88,10 @@ class TestValidateAtcResponse:
         assert result.valid is False
         assert any("too short" in i for i in result.issues)
     
-    def test_invalid_squawk_with_8(self):
-        """Squawk codes with 8 are invalid (octal)."""
-        result = validate_atc_response("Squawk 8521")
-        assert any("Invalid squawk" in i for i in result.issues)
-    
-    def test_invalid_squawk_with_9(self):
-        """Squawk codes with 9 are invalid (octal)."""
-        result = validate_atc_response("Squawk 4591")
+    @pytest.mark.parametrize("response", ["Squawk 8521", "Squawk 4591"], ids=["with_8", "with_9"])
+    def test_invalid_squawk(self, response):
+        """Squawk codes with 8 or 9 are invalid (octal)."""
+        result = validate_atc_response(response)
         assert any("Invalid squawk" in i for i in result.issues)
     
     def test_valid_squawk(self):
@@ -164,27 +124,20 @@ class TestIsWithinScope:
         )
         assert in_scope is True
     
-    def test_ifr_approach_out_of_scope(self):
-        """IFR approach is out of scope."""
-        in_scope, reason = is_within_scope(
-            "Cessna 12345, cleared ILS runway 28 approach"
-        )
-        assert in_scope is False
-        assert "IFR" in reason
-    
-    def test_sid_out_of_scope(self):
-        """SID routing is out of scope."""
-        in_scope, reason = is_within_scope(
-            "Cessna 12345, cleared SID departure"
-        )
-        assert in_scope is False
-    
-    def test_star_out_of_scope(self):
-        """STAR routing is out of scope."""
-        in_scope, reason = is_within_scope(
-            "Cessna 12345, cleared STAR arrival"
-        )
+    @pytest.mark.parametrize(
+        "response,reason_part",
+        [
+            ("Cessna 12345, cleared ILS runway 28 approach", "IFR"),
+            ("Cessna 12345, cleared SID departure", "SID"),
+            ("Cessna 12345, cleared STAR arrival", "STAR"),
+        ],
+        ids=["ifr_approach", "sid", "star"],
+    )
+    def test_out_of_scope(self, response, reason_part):
+        """IFR approaches, SIDs and STARs are out of scope."""
+        in_scope, reason = is_within_scope(response)
         assert in_scope is False
+        assert reason_part in reason
 
 
 if __name__ == "__main__":
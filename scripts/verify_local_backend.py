@@ -2,6 +2,7 @@
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add client source to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../client/src")))
@@ -32,13 +33,17 @@ def main():
         
     # 3. Test Methods (Mock if needed, or real)
     if provider.connected:
-        print("\n[3] Testing 'Think' (AI)...")
-        resp = provider.think("System check.")
-        print(f"    Response: {resp}")
-        
-        print("\n[4] Testing 'Say' (TTS)...")
-        resp = provider.say("Verification complete.")
-        print(f"    Response: {resp}")
+        # Think and Say are independent D-Bus calls; run them together and
+        # report in order
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            think_future = pool.submit(provider.think, "System check.")
+            say_future = pool.submit(provider.say, "Verification complete.")
+            
+            print("\n[3] Testing 'Think' (AI)...")
+            print(f"    Response: {think_future.result()}")
+            
+            print("\n[4] Testing 'Say' (TTS)...")
+            print(f"    Response: {say_future.result()}")
     else:
         print("\n[Skipping method tests due to no connection]")
 
@@ -9,7 +9,7 @@ No plugin required - X-Plane 12.1.1+ has this built-in.
 import json
 import urllib.request
 import urllib.error
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 
 API_BASE = "http://localhost:8086/api/v2"
 
@@ -31,12 +31,26 @@ def api_get(endpoint: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def find_dataref_id(name: str, all_datarefs: list) -> Optional[int]:
-    """Find the ID for a dataref by name."""
-    for dr in all_datarefs:
-        if dr.get("name") == name:
-            return dr.get("id")
-    return None
+# Value formatters keyed by a substring of the dataref name; the first
+# matching key wins
+VALUE_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    "latitude": lambda v: f"{v:.6f}°",
+    "longitude": lambda v: f"{v:.6f}°",
+    "elevation": lambda v: f"{v:.1f} m ({v * 3.28084:.0f} ft)",
+    "mag_psi": lambda v: f"{v:.1f}°",
+    "airspeed": lambda v: f"{v:.1f} kts",
+    "frequency": lambda v: f"{(v / 1000 if v > 1000 else v):.3f} MHz",
+    "transponder": lambda v: f"{int(v):04d}",
+}
+
+
+def format_value(name: str, value: Any) -> str:
+    """Format a dataref value for display based on its name."""
+    if value != "N/A":
+        for key, formatter in VALUE_FORMATTERS.items():
+            if key in name:
+                return formatter(value)
+    return f"{value}"
 
 
 def read_dataref_by_filter(name_pattern: str) -> None:
@@ -79,15 +93,16 @@ def main():
         "sim/cockpit/radios/transponder_code",
     ]
     
+    # Index the listing by name once instead of rescanning it per target
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for dr in datarefs:
+        by_name.setdefault(dr.get("name"), dr)
+    
     found_refs = {}
     for target in target_refs:
-        dr_id = find_dataref_id(target, datarefs)
-        if dr_id:
-            # Find the full object to get the value
-            for dr in datarefs:
-                if dr.get("name") == target:
-                    found_refs[target] = dr
-                    break
+        dr = by_name.get(target)
+        if dr and dr.get("id"):
+            found_refs[target] = dr
     
     print(f"Found {len(found_refs)}/{len(target_refs)} target DataRefs")
     
@@ -98,41 +113,7 @@ def main():
     for name, dr in found_refs.items():
         short_name = name.split("/")[-1]
         value = dr.get("value", "N/A")
-        
-        # Format based on type
-        if "latitude" in name or "longitude" in name:
-            if value != "N/A":
-                print(f"  {short_name:25}: {value:.6f}°")
-            else:
-                print(f"  {short_name:25}: {value}")
-        elif "elevation" in name:
-            if value != "N/A":
-                print(f"  {short_name:25}: {value:.1f} m ({value * 3.28084:.0f} ft)")
-            else:
-                print(f"  {short_name:25}: {value}")
-        elif "mag_psi" in name:
-            if value != "N/A":
-                print(f"  {short_name:25}: {value:.1f}°")
-            else:
-                print(f"  {short_name:25}: {value}")
-        elif "airspeed" in name:
-            if value != "N/A":
-                print(f"  {short_name:25}: {value:.1f} kts")
-            else:
-                print(f"  {short_name:25}: {value}")
-        elif "frequency" in name:
-            if value != "N/A":
-                freq_mhz = value / 1000 if value > 1000 else value
-                print(f"  {short_name:25}: {freq_mhz:.3f} MHz")
-            else:
-                print(f"  {short_name:25}: {value}")
-        elif "transponder" in name:
-            if value != "N/A":
-                print(f"  {short_name:25}: {int(value):04d}")
-            else:
-                print(f"  {short_name:25}: {value}")
-        else:
-            print(f"  {short_name:25}: {value}")
+        print(f"  {short_name:25}: {format_value(name, value)}")
     
     # Test 4: Check if values are included in listing
     print("\n[4] API Value Inclusion Check:")
@@ -14,8 +14,18 @@ try:
 except ImportError:
     HAS_WEBSOCKETS = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
 WEBSOCKET_URL = "ws://localhost:8086/api/v2/websocket"
 
+# Parser for incoming frames (orjson when installed)
+_loads = orjson.loads if HAS_ORJSON else json.loads
+
 
 async def test_websocket():
     """Test WebSocket connection and DataRef subscription."""
@@ -31,7 +41,8 @@ async def test_websocket():
     print(f"\n[1] Connecting to {WEBSOCKET_URL}...")
     
     try:
-        async with websockets.connect(WEBSOCKET_URL, ping_timeout=10) as ws:
+        # Dataref frames are small; skip per-frame permessage-deflate
+        async with websockets.connect(WEBSOCKET_URL, ping_timeout=10, compression=None) as ws:
             print("SUCCESS: Connected!")
             
             # Subscribe to position datarefs
@@ -61,28 +72,27 @@ async def test_websocket():
             print("-" * 50)
             
             received_values = {}
-            start_time = asyncio.get_event_loop().time()
             
+            async def receive():
+                async for msg in ws:
+                    data = _loads(msg)
+                    
+                    if data.get("type") == "dataref_value":
+                        name = data.get("name", "unknown")
+                        value = data.get("value")
+                        short_name = name.split("/")[-1]
+                        received_values[short_name] = value
+                        print(f"  {short_name}: {value}")
+                    elif data.get("type") == "result":
+                        print(f"  [Result] success={data.get('success')}")
+                    else:
+                        print(f"  [Other] {data.get('type', 'unknown')}: {str(data)[:100]}")
+            
+            # One timeout for the whole window rather than a wait_for per frame
             try:
-                while (asyncio.get_event_loop().time() - start_time) < 5:
-                    try:
-                        msg = await asyncio.wait_for(ws.recv(), timeout=1.0)
-                        data = json.loads(msg)
-                        
-                        if data.get("type") == "dataref_value":
-                            name = data.get("name", "unknown")
-                            value = data.get("value")
-                            short_name = name.split("/")[-1]
-                            received_values[short_name] = value
-                            print(f"  {short_name}: {value}")
-                        elif data.get("type") == "result":
-                            print(f"  [Result] success={data.get('success')}")
-                        else:
-                            print(f"  [Other] {data.get('type', 'unknown')}: {str(data)[:100]}")
-                            
-                    except asyncio.TimeoutError:
-                        continue
-                        
+                await asyncio.wait_for(receive(), timeout=5)
+            except asyncio.TimeoutError:
+                pass
             except Exception as e:
                 print(f"Error receiving: {e}")
             